@@ -189,6 +189,17 @@ def format_unix_timestamp(timestamp: int | None) -> str | None:
         return None
 
 
+# Search sort aliases → SearchQuery.order_by values, shared across requests
+SEARCH_SORT_MAPPING = {
+    "relevance": "rank",
+    "score": "score",
+    "created_utc": "created_utc",
+    "date": "created_utc",
+    "new": "created_utc",
+    "old": "created_utc_asc",
+}
+
+
 # ============================================================================
 # FIELD SELECTION AND TRUNCATION (MCP-optimized)
 # ============================================================================
@@ -2230,15 +2241,7 @@ def api_search():
     sort = request.args.get("sort", parsed.sort_by or "relevance").lower()
 
     # Map sort values
-    sort_mapping = {
-        "relevance": "rank",
-        "score": "score",
-        "created_utc": "created_utc",
-        "date": "created_utc",
-        "new": "created_utc",
-        "old": "created_utc_asc",
-    }
-    order_by = sort_mapping.get(sort, "rank")
+    order_by = SEARCH_SORT_MAPPING.get(sort, "rank")
 
     # Determine result type
     result_type = None
@@ -38,6 +38,9 @@ class BaseImporter(ABC):
         if self.PLATFORM_ID is None:
             raise NotImplementedError(f"{self.__class__.__name__} must set PLATFORM_ID class attribute")
 
+        # Built once: prefix_id runs per record, so keep it to a single concat
+        self._id_prefix = f"{self.PLATFORM_ID}_"
+
     @abstractmethod
     def detect_files(self, input_dir: str) -> dict[str, list[str]]:
         """
@@ -105,7 +108,7 @@ class BaseImporter(ABC):
         Returns:
             str: Prefixed ID (e.g., 'reddit_abc123', 'voat_456')
         """
-        return f"{self.PLATFORM_ID}_{raw_id}"
+        return self._id_prefix + str(raw_id)
 
     def get_platform_metadata(self) -> dict[str, str]:
         """
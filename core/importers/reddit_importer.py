@@ -10,18 +10,75 @@ Reddit format:
 Data source: Pushshift Reddit archives or custom .zst dumps
 """
 
-import glob
-import json
 import logging
 import os
-from collections.abc import Iterator
+import queue
+import re
+import threading
+from collections.abc import Callable, Iterator
 from typing import Any
 
-from ..watchful import read_lines_zst
+import orjson
+import zstandard
+from psycopg.types.json import Jsonb
+
+# Optional streaming parser for concatenated JSON-array dumps (some
+# Pushshift mirrors ship arrays instead of JSONL); without it those
+# files simply fail per-line parsing as before
+try:
+    import ijson as _ijson
+except ImportError:
+    _ijson = None
+
+from ..postgres_database import COMMENTS_STAGING_DDL, POSTS_STAGING_DDL
+from ..watchful import read_lines_zst_bytes
 from .base_importer import BaseImporter
 
 logger = logging.getLogger(__name__)
 
+# Column lists and COPY types for the binary ingestion path.
+# Mirrors the staging-table schema used by PostgresDatabase batch inserts.
+_POST_COLUMNS = (
+    "id, subreddit, author, title, selftext, url, domain, permalink, "
+    "created_utc, score, num_comments, is_self, over_18, locked, stickied, platform, json_data"
+)
+_POST_COPY_TYPES = [
+    "text", "text", "text", "text", "text", "text", "text", "text",
+    "int8", "int4", "int4", "bool", "bool", "bool", "bool", "text", "jsonb",
+]
+
+_COMMENT_COLUMNS = (
+    "id, post_id, parent_id, subreddit, author, body, permalink, link_id, "
+    "created_utc, score, depth, platform, json_data"
+)
+_COMMENT_COPY_TYPES = [
+    "text", "text", "text", "text", "text", "text", "text", "text",
+    "int8", "int4", "int4", "text", "jsonb",
+]
+
+# Lines per work unit handed to parallel parse workers
+_PARALLEL_CHUNK_LINES = 8192
+
+# Pushshift naming keywords, matched case-insensitively in one regex pass
+# instead of per-keyword substring scans over lowered copies
+_ZST_NAME_KEYWORDS = re.compile(r"submission|post|comment", re.IGNORECASE)
+
+# Required raw fields, checked with a single C-level set comparison in the
+# batch normalizers (dict.keys() >= frozenset)
+_REQUIRED_POST = frozenset({"id", "subreddit", "author", "title", "created_utc"})
+_REQUIRED_COMMENT = frozenset({"id", "link_id", "subreddit", "author", "body", "created_utc"})
+
+
+def _strip_type_prefix(thing_id: str) -> str:
+    """Strip a Reddit thing-type prefix (t1_, t3_, ...) from an ID.
+
+    Two indexed char compares and one slice - cheaper per call than a
+    startswith chain or a regex on the comment normalization hot path.
+    """
+    if len(thing_id) > 3 and thing_id[0] == "t" and thing_id[2] == "_":
+        return thing_id[3:]
+    return thing_id
+
 
 class RedditImporter(BaseImporter):
     """
@@ -33,6 +90,23 @@ class RedditImporter(BaseImporter):
 
     PLATFORM_ID = "reddit"
 
+    def __init__(self, read_buffer_bytes: int = 2**27, parallel: bool = False, workers: int | None = None):
+        """Initialize importer.
+
+        Args:
+            read_buffer_bytes: Decompressed bytes pulled from the zstd
+                stream per read (default 128 MiB); tests can pass a small
+                value to exercise the chunk-boundary handling
+            parallel: Run decompression and JSON parse/normalize as a
+                producer/worker pipeline instead of a single serial loop
+            workers: Parse worker threads for the parallel pipeline
+                (default: CPU count)
+        """
+        super().__init__()
+        self.read_buffer_bytes = read_buffer_bytes
+        self.parallel = parallel
+        self.workers = workers or (os.cpu_count() or 4)
+
     def detect_files(self, input_dir: str) -> dict[str, list[str]]:
         """
         Detect Reddit .zst archive files in directory.
@@ -46,18 +120,22 @@ class RedditImporter(BaseImporter):
         Raises:
             FileNotFoundError: If no .zst files found
         """
-        # Look for .zst files with typical Pushshift naming patterns
-        all_zst_files = glob.glob(os.path.join(input_dir, "*.zst"))
-
+        # Look for .zst files with typical Pushshift naming patterns.
+        # os.scandir avoids the per-entry stat of glob and the compiled
+        # regex classifies each name in a single pass without .lower() copies
         posts_files = []
         comments_files = []
 
-        for file_path in all_zst_files:
-            basename = os.path.basename(file_path).lower()
-            if "submission" in basename or "post" in basename:
-                posts_files.append(file_path)
-            elif "comment" in basename:
-                comments_files.append(file_path)
+        with os.scandir(input_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".zst") or not entry.is_file():
+                    continue
+                keywords = {match.lower() for match in _ZST_NAME_KEYWORDS.findall(name)}
+                if keywords & {"submission", "post"}:
+                    posts_files.append(entry.path)
+                elif "comment" in keywords:
+                    comments_files.append(entry.path)
 
         if not posts_files and not comments_files:
             raise FileNotFoundError(
@@ -73,7 +151,8 @@ class RedditImporter(BaseImporter):
         """
         Stream posts from Reddit .zst archive.
 
-        Uses existing read_lines_zst() function for decompression.
+        Uses read_lines_zst_bytes() so decompressed lines reach orjson
+        without an intermediate UTF-8 decode.
 
         Args:
             file_path: Path to .zst archive
@@ -84,22 +163,34 @@ class RedditImporter(BaseImporter):
         """
         logger.info(f"Streaming posts from {os.path.basename(file_path)}")
 
+        if _ijson is not None and self._is_array_dump(file_path):
+            yield from self._stream_array(file_path, self._normalize_post, filter_communities)
+            return
+
+        if self.parallel:
+            yield from self._iter_parallel(file_path, self._normalize_post_batch, filter_communities)
+            return
+
         line_count = 0
         valid_count = 0
         filtered_count = 0
 
-        for line, _ in read_lines_zst(file_path):
+        # Precompute the lowered filter once: O(1) membership per record
+        # instead of re-lowering the whole filter list every line
+        filter_set = frozenset(s.lower() for s in filter_communities) if filter_communities else None
+
+        # Bytes lines feed orjson directly - no per-line UTF-8 decode
+        for line, _ in read_lines_zst_bytes(file_path, read_size=self.read_buffer_bytes):
             line_count += 1
 
             if not line.strip():
                 continue
 
             try:
-                obj = json.loads(line)
+                obj = orjson.loads(line)
 
                 # Apply community filter if provided
-                subreddit = obj.get("subreddit", "")
-                if filter_communities and subreddit.lower() not in [s.lower() for s in filter_communities]:
+                if filter_set is not None and obj.get("subreddit", "").lower() not in filter_set:
                     filtered_count += 1
                     continue
 
@@ -109,7 +200,7 @@ class RedditImporter(BaseImporter):
                     valid_count += 1
                     yield normalized
 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.warning(f"Failed to parse JSON line {line_count}: {e}")
                 continue
 
@@ -128,22 +219,34 @@ class RedditImporter(BaseImporter):
         """
         logger.info(f"Streaming comments from {os.path.basename(file_path)}")
 
+        if _ijson is not None and self._is_array_dump(file_path):
+            yield from self._stream_array(file_path, self._normalize_comment, filter_communities)
+            return
+
+        if self.parallel:
+            yield from self._iter_parallel(file_path, self._normalize_comment_batch, filter_communities)
+            return
+
         line_count = 0
         valid_count = 0
         filtered_count = 0
 
-        for line, _ in read_lines_zst(file_path):
+        # Precompute the lowered filter once: O(1) membership per record
+        # instead of re-lowering the whole filter list every line
+        filter_set = frozenset(s.lower() for s in filter_communities) if filter_communities else None
+
+        # Bytes lines feed orjson directly - no per-line UTF-8 decode
+        for line, _ in read_lines_zst_bytes(file_path, read_size=self.read_buffer_bytes):
             line_count += 1
 
             if not line.strip():
                 continue
 
             try:
-                obj = json.loads(line)
+                obj = orjson.loads(line)
 
                 # Apply community filter if provided
-                subreddit = obj.get("subreddit", "")
-                if filter_communities and subreddit.lower() not in [s.lower() for s in filter_communities]:
+                if filter_set is not None and obj.get("subreddit", "").lower() not in filter_set:
                     filtered_count += 1
                     continue
 
@@ -153,7 +256,7 @@ class RedditImporter(BaseImporter):
                     valid_count += 1
                     yield normalized
 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.warning(f"Failed to parse JSON line {line_count}: {e}")
                 continue
 
@@ -161,6 +264,444 @@ class RedditImporter(BaseImporter):
             f"Reddit comments: {line_count} lines processed, {valid_count} valid comments, {filtered_count} filtered"
         )
 
+    def _is_array_dump(self, file_path: str) -> bool:
+        """
+        Check whether a .zst dump is a concatenated JSON array rather than
+        JSON Lines by peeking at the first decompressed bytes.
+
+        Args:
+            file_path: Path to .zst archive
+
+        Returns:
+            bool: True if the dump opens with '['
+        """
+        with open(file_path, "rb") as fh:
+            reader = zstandard.ZstdDecompressor(max_window_size=2**31).stream_reader(fh)
+            head = reader.read(64)
+        return head.lstrip()[:1] == b"["
+
+    def _stream_array(
+        self,
+        file_path: str,
+        normalizer: Callable[[dict[str, Any]], dict[str, Any] | None],
+        filter_communities: list[str] | None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream records out of a JSON-array dump via ijson without
+        materializing the array, keeping peak memory at O(one record).
+
+        Args:
+            file_path: Path to .zst archive
+            normalizer: _normalize_post or _normalize_comment
+            filter_communities: Optional list of communities to include
+
+        Yields:
+            dict: Normalized records
+        """
+        filter_set = {s.lower() for s in filter_communities} if filter_communities else None
+
+        with open(file_path, "rb") as fh:
+            reader = zstandard.ZstdDecompressor(max_window_size=2**31).stream_reader(fh)
+            for obj in _ijson.items(reader, "item"):
+                if filter_set is not None and obj.get("subreddit", "").lower() not in filter_set:
+                    continue
+                normalized = normalizer(obj)
+                if normalized:
+                    yield normalized
+
+    def _iter_parallel(
+        self,
+        file_path: str,
+        batch_normalizer: Callable[[list[dict[str, Any]]], list[dict[str, Any]]],
+        filter_communities: list[str] | None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Pipeline variant of the streaming loop: one producer thread
+        decompresses and chunks raw lines, N workers parse/filter/normalize,
+        and the consumer reassembles chunks by sequence number so output
+        order matches the serial path exactly.
+
+        Args:
+            file_path: Path to .zst archive
+            batch_normalizer: _normalize_post_batch or _normalize_comment_batch
+            filter_communities: Optional list of communities to include
+
+        Yields:
+            dict: Normalized records, in file order
+        """
+        workers = self.workers
+        in_q: queue.Queue = queue.Queue(maxsize=workers * 2)
+        out_q: queue.Queue = queue.Queue(maxsize=workers * 2)
+        filter_set = {s.lower() for s in filter_communities} if filter_communities else None
+        pipeline_errors: list[Exception] = []
+
+        def producer() -> None:
+            seq = 0
+            lines: list[bytes] = []
+            try:
+                for line, _ in read_lines_zst_bytes(file_path, read_size=self.read_buffer_bytes):
+                    lines.append(line)
+                    if len(lines) >= _PARALLEL_CHUNK_LINES:
+                        in_q.put((seq, lines))
+                        seq += 1
+                        lines = []
+                if lines:
+                    in_q.put((seq, lines))
+            except Exception as e:  # Surface decompression errors to the consumer
+                pipeline_errors.append(e)
+            finally:
+                for _ in range(workers):
+                    in_q.put(None)
+
+        def worker() -> None:
+            # The whole body is guarded: an unexpected error (bad record
+            # shape in the filter or normalizer) must still post the None
+            # sentinel, otherwise the consumer blocks forever - the error
+            # is propagated to the caller like producer failures.
+            try:
+                while True:
+                    item = in_q.get()
+                    if item is None:
+                        return
+                    seq, lines = item
+                    raws = []
+                    for line in lines:
+                        if not line.strip():
+                            continue
+                        try:
+                            obj = orjson.loads(line)
+                        except orjson.JSONDecodeError:
+                            continue
+                        if filter_set is not None and obj.get("subreddit", "").lower() not in filter_set:
+                            continue
+                        raws.append(obj)
+                    out_q.put((seq, batch_normalizer(raws)))
+            except Exception as e:
+                pipeline_errors.append(e)
+            finally:
+                out_q.put(None)
+
+        threads = [threading.Thread(target=producer, daemon=True)]
+        threads.extend(threading.Thread(target=worker, daemon=True) for _ in range(workers))
+        for t in threads:
+            t.start()
+
+        # Deterministic reassembly: buffer out-of-order chunks and release
+        # them strictly by sequence number
+        pending: dict[int, list[dict[str, Any]]] = {}
+        next_seq = 0
+        finished_workers = 0
+
+        while finished_workers < workers:
+            item = out_q.get()
+            if item is None:
+                finished_workers += 1
+                continue
+            seq, results = item
+            pending[seq] = results
+            while next_seq in pending:
+                yield from pending.pop(next_seq)
+                next_seq += 1
+
+        while next_seq in pending:
+            yield from pending.pop(next_seq)
+            next_seq += 1
+
+        if pipeline_errors:
+            # If every worker died early the producer may still be blocked
+            # on a full in_q - drain until it exits so join can't deadlock
+            while threads[0].is_alive():
+                try:
+                    in_q.get(timeout=0.05)
+                except queue.Empty:
+                    pass
+
+        for t in threads:
+            t.join()
+
+        if pipeline_errors:
+            raise pipeline_errors[0]
+
+    def import_posts(
+        self, file_path: str, db, filter_communities: list[str] | None = None, batch_size: int = 5000
+    ) -> tuple[int, int]:
+        """
+        Stream posts from a .zst archive straight into PostgreSQL via binary COPY.
+
+        Skips the intermediate list-of-dicts batching: each normalized record
+        is written into a staging table with COPY ... FORMAT BINARY and
+        upserted in batches, so ingestion stays decompression-bound instead
+        of INSERT-bound.
+
+        Args:
+            file_path: Path to .zst archive
+            db: PostgresDatabase instance
+            filter_communities: Optional list of subreddits to include
+            batch_size: Records per COPY/upsert round trip
+
+        Returns:
+            tuple: (successful_inserts, failed_inserts)
+        """
+        upsert_sql = f"""
+            INSERT INTO posts ({_POST_COLUMNS})
+            SELECT {_POST_COLUMNS} FROM posts_staging
+            ON CONFLICT (id) DO UPDATE SET
+                score = EXCLUDED.score,
+                num_comments = EXCLUDED.num_comments,
+                json_data = EXCLUDED.json_data
+        """
+
+        def post_row(post: dict[str, Any]) -> tuple:
+            return (
+                post["id"],
+                post["subreddit"],
+                post.get("author", "[deleted]"),
+                post["title"],
+                post.get("selftext", ""),
+                post.get("url", ""),
+                post.get("domain", ""),
+                post.get("permalink", ""),
+                int(post.get("created_utc", 0)),
+                int(post.get("score", 0)),
+                int(post.get("num_comments", 0)),
+                bool(post.get("is_self", False)),
+                bool(post.get("over_18", False)),
+                bool(post.get("locked", False)),
+                bool(post.get("stickied", False)),
+                post.get("platform", self.PLATFORM_ID),
+                # Same NaN/Infinity/Decimal sanitation the batch inserts
+                # apply - an unserializable value must not sink the batch
+                Jsonb(db._sanitize_recursive(post["json_data"])),
+            )
+
+        return self._copy_records(
+            self.stream_posts(file_path, filter_communities),
+            db,
+            staging_ddl=POSTS_STAGING_DDL,
+            copy_sql=f"COPY posts_staging ({_POST_COLUMNS}) FROM STDIN WITH (FORMAT BINARY)",
+            copy_types=_POST_COPY_TYPES,
+            upsert_sql=upsert_sql,
+            make_row=post_row,
+            batch_size=batch_size,
+            record_type="posts",
+        )
+
+    def import_comments(
+        self, file_path: str, db, filter_communities: list[str] | None = None, batch_size: int = 5000
+    ) -> tuple[int, int]:
+        """
+        Stream comments from a .zst archive straight into PostgreSQL via binary COPY.
+
+        Args:
+            file_path: Path to .zst archive
+            db: PostgresDatabase instance
+            filter_communities: Optional list of subreddits to include
+            batch_size: Records per COPY/upsert round trip
+
+        Returns:
+            tuple: (successful_inserts, failed_inserts)
+        """
+        upsert_sql = f"""
+            INSERT INTO comments ({_COMMENT_COLUMNS})
+            SELECT {_COMMENT_COLUMNS} FROM comments_staging
+            ON CONFLICT (id) DO UPDATE SET
+                score = EXCLUDED.score,
+                json_data = EXCLUDED.json_data
+        """
+
+        def comment_row(comment: dict[str, Any]) -> tuple:
+            return (
+                comment["id"],
+                comment["post_id"],
+                comment.get("parent_id"),
+                comment["subreddit"],
+                comment.get("author", "[deleted]"),
+                comment["body"],
+                comment.get("permalink", ""),
+                comment.get("link_id"),
+                int(comment.get("created_utc", 0)),
+                int(comment.get("score", 0)),
+                int(comment.get("depth", 0)),
+                comment.get("platform", self.PLATFORM_ID),
+                Jsonb(db._sanitize_recursive(comment["json_data"])),
+            )
+
+        return self._copy_records(
+            self.stream_comments(file_path, filter_communities),
+            db,
+            staging_ddl=COMMENTS_STAGING_DDL,
+            copy_sql=f"COPY comments_staging ({_COMMENT_COLUMNS}) FROM STDIN WITH (FORMAT BINARY)",
+            copy_types=_COMMENT_COPY_TYPES,
+            upsert_sql=upsert_sql,
+            make_row=comment_row,
+            batch_size=batch_size,
+            record_type="comments",
+        )
+
+    def _copy_records(
+        self,
+        records: Iterator[dict[str, Any]],
+        db,
+        staging_ddl: str,
+        copy_sql: str,
+        copy_types: list[str],
+        upsert_sql: str,
+        make_row,
+        batch_size: int,
+        record_type: str,
+    ) -> tuple[int, int]:
+        """
+        Shared binary-COPY loop: stage batches with write_row, then upsert.
+
+        Args:
+            records: Iterator of normalized record dicts
+            db: PostgresDatabase instance
+            staging_ddl: CREATE TEMPORARY TABLE statement for the staging table
+            copy_sql: COPY ... FROM STDIN WITH (FORMAT BINARY) statement
+            copy_types: PostgreSQL type names for Copy.set_types()
+            upsert_sql: INSERT ... SELECT FROM staging ON CONFLICT statement
+            make_row: Callable converting a record dict to a COPY row tuple
+            batch_size: Records per COPY/upsert round trip
+            record_type: 'posts' or 'comments' for log messages
+
+        Returns:
+            tuple: (successful_inserts, failed_inserts)
+        """
+        successful = 0
+        failed = 0
+
+        with db.pool.get_connection() as conn:
+            batch: list[tuple] = []
+
+            def flush() -> None:
+                nonlocal successful, failed
+                if not batch:
+                    return
+                try:
+                    with conn.cursor() as cur:
+                        cur.execute("DROP TABLE IF EXISTS posts_staging, comments_staging")
+                        cur.execute(staging_ddl)
+                        with cur.copy(copy_sql) as copy:
+                            copy.set_types(copy_types)
+                            for row in batch:
+                                copy.write_row(row)
+                        cur.execute(upsert_sql)
+                    conn.commit()
+                    successful += len(batch)
+                except Exception as e:
+                    conn.rollback()
+                    logger.error(f"Binary COPY batch failed for {record_type}: {e}")
+                    failed += len(batch)
+                batch.clear()
+
+            for record in records:
+                batch.append(make_row(record))
+                if len(batch) >= batch_size:
+                    flush()
+            flush()
+
+        logger.info(f"Binary COPY import: {successful} {record_type} inserted, {failed} failed")
+        return successful, failed
+
+    def _normalize_post_batch(self, raw_posts: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Normalize a batch of raw posts in one pass.
+
+        Bulk-ingestion variant of _normalize_post: required-field validation
+        is a single set comparison per record and the ID prefix is formatted
+        without method dispatch. Invalid records are dropped silently (the
+        caller can diff lengths); field list must stay in sync with
+        _normalize_post.
+
+        Args:
+            raw_posts: Raw Reddit post dicts from Pushshift
+
+        Returns:
+            list: Normalized post dicts (invalid records omitted)
+        """
+        out = []
+        append = out.append
+        prefix = f"{self.PLATFORM_ID}_"
+        platform = self.PLATFORM_ID
+
+        for post in raw_posts:
+            if not (_REQUIRED_POST <= post.keys()):
+                continue
+            append(
+                {
+                    "id": prefix + str(post["id"]),
+                    "platform": platform,
+                    "subreddit": post["subreddit"],
+                    "author": post["author"],
+                    "title": post["title"],
+                    "selftext": post.get("selftext", ""),
+                    "url": post.get("url", ""),
+                    "domain": post.get("domain", ""),
+                    "permalink": post.get("permalink", ""),
+                    "created_utc": post["created_utc"],
+                    "score": post.get("score", 0),
+                    "ups": post.get("ups", 0),
+                    "downs": post.get("downs", 0),
+                    "num_comments": post.get("num_comments", 0),
+                    "is_self": post.get("is_self", False),
+                    "over_18": post.get("over_18", False),
+                    "locked": post.get("locked", False),
+                    "stickied": post.get("stickied", False),
+                    "archived": post.get("archived", False),
+                    "json_data": post,
+                }
+            )
+
+        return out
+
+    def _normalize_comment_batch(self, raw_comments: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Normalize a batch of raw comments in one pass.
+
+        Bulk-ingestion variant of _normalize_comment; field list must stay
+        in sync with it.
+
+        Args:
+            raw_comments: Raw Reddit comment dicts from Pushshift
+
+        Returns:
+            list: Normalized comment dicts (invalid records omitted)
+        """
+        out = []
+        append = out.append
+        prefix = f"{self.PLATFORM_ID}_"
+        platform = self.PLATFORM_ID
+
+        for comment in raw_comments:
+            if not (_REQUIRED_COMMENT <= comment.keys()):
+                continue
+
+            link_id = comment["link_id"]
+            post_id = prefix + _strip_type_prefix(link_id)
+            parent_id = prefix + _strip_type_prefix(comment.get("parent_id", link_id))
+
+            append(
+                {
+                    "id": prefix + str(comment["id"]),
+                    "platform": platform,
+                    "post_id": post_id,
+                    "parent_id": parent_id,
+                    "subreddit": comment["subreddit"],
+                    "author": comment["author"],
+                    "body": comment["body"],
+                    "permalink": comment.get("permalink", ""),
+                    "link_id": link_id,
+                    "created_utc": comment["created_utc"],
+                    "score": comment.get("score", 0),
+                    "ups": comment.get("ups", 0),
+                    "downs": comment.get("downs", 0),
+                    "depth": comment.get("depth", 0),
+                    "json_data": comment,
+                }
+            )
+
+        return out
+
     def _normalize_post(self, reddit_post: dict[str, Any]) -> dict[str, Any] | None:
         """
         Normalize Reddit post to common schema.
@@ -174,9 +715,10 @@ class RedditImporter(BaseImporter):
         Returns:
             dict or None: Normalized post or None if validation fails
         """
-        # Validate required fields
-        required = ["id", "subreddit", "author", "title", "created_utc"]
-        if not self.validate_required_fields(reddit_post, required, "post"):
+        # Validate required fields: one C-level set comparison on the hot
+        # path; the logging walk only runs for the rare invalid record
+        if not (_REQUIRED_POST <= reddit_post.keys()):
+            self.validate_required_fields(reddit_post, sorted(_REQUIRED_POST), "post")
             return None
 
         # Reddit posts already match our schema, just add platform and prefix ID
@@ -218,26 +760,18 @@ class RedditImporter(BaseImporter):
         Returns:
             dict or None: Normalized comment or None if validation fails
         """
-        # Validate required fields
-        required = ["id", "link_id", "subreddit", "author", "body", "created_utc"]
-        if not self.validate_required_fields(reddit_comment, required, "comment"):
+        # Validate required fields: one C-level set comparison on the hot
+        # path; the logging walk only runs for the rare invalid record
+        if not (_REQUIRED_COMMENT <= reddit_comment.keys()):
+            self.validate_required_fields(reddit_comment, sorted(_REQUIRED_COMMENT), "comment")
             return None
 
         # Extract post ID from link_id (format: t3_abc123)
         link_id = reddit_comment["link_id"]
-        if link_id.startswith("t3_"):
-            post_id = self.prefix_id(link_id[3:])
-        else:
-            post_id = self.prefix_id(link_id)
-
-        # Extract parent ID (could be post or another comment)
-        parent_id_raw = reddit_comment.get("parent_id", link_id)
-        if parent_id_raw.startswith("t1_"):  # Comment parent
-            parent_id = self.prefix_id(parent_id_raw[3:])
-        elif parent_id_raw.startswith("t3_"):  # Post parent
-            parent_id = self.prefix_id(parent_id_raw[3:])
-        else:
-            parent_id = self.prefix_id(parent_id_raw)
+        post_id = self.prefix_id(_strip_type_prefix(link_id))
+
+        # Extract parent ID (could be a post t3_ or another comment t1_)
+        parent_id = self.prefix_id(_strip_type_prefix(reddit_comment.get("parent_id", link_id)))
 
         # Reddit comments already match our schema, just add platform and prefix IDs
         normalized = {
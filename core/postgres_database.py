@@ -24,6 +24,49 @@ from utils.console_output import print_error, print_info, print_success, print_w
 
 logger = logging.getLogger(__name__)
 
+# Staging-table DDL shared by the batch inserts below and the importers'
+# binary-COPY path (core/importers/reddit_importer.py). Columns mirror the
+# posts/comments tables in sql/schema.sql minus auto-generated created_at.
+POSTS_STAGING_DDL = """
+    CREATE TEMPORARY TABLE posts_staging (
+        id TEXT PRIMARY KEY,
+        subreddit TEXT NOT NULL,
+        author TEXT NOT NULL,
+        title TEXT NOT NULL,
+        selftext TEXT,
+        url TEXT,
+        domain TEXT,
+        permalink TEXT NOT NULL,
+        created_utc BIGINT NOT NULL,
+        score INTEGER DEFAULT 0,
+        num_comments INTEGER DEFAULT 0,
+        is_self BOOLEAN DEFAULT false,
+        over_18 BOOLEAN DEFAULT false,
+        locked BOOLEAN DEFAULT false,
+        stickied BOOLEAN DEFAULT false,
+        platform TEXT DEFAULT 'reddit' NOT NULL,
+        json_data JSONB NOT NULL
+    ) ON COMMIT DROP
+"""
+
+COMMENTS_STAGING_DDL = """
+    CREATE TEMPORARY TABLE comments_staging (
+        id TEXT PRIMARY KEY,
+        post_id TEXT NOT NULL,
+        parent_id TEXT,
+        subreddit TEXT NOT NULL,
+        author TEXT NOT NULL,
+        body TEXT NOT NULL,
+        permalink TEXT NOT NULL,
+        link_id TEXT,
+        created_utc BIGINT NOT NULL,
+        score INTEGER DEFAULT 0,
+        depth INTEGER DEFAULT 0,
+        platform TEXT DEFAULT 'reddit' NOT NULL,
+        json_data JSONB NOT NULL
+    ) ON COMMIT DROP
+"""
+
 
 def retry_with_exponential_backoff(
     max_retries: int = 5, initial_delay: float = 1.0, max_delay: float = 60.0, backoff_factor: float = 2.0
@@ -412,6 +455,10 @@ class PostgresDatabase:
 
         self.connection_timeout = connection_timeout
 
+        # Per-thread state for transaction() blocks (shared connection for
+        # batch inserts that should commit together)
+        self._txn_local = threading.local()
+
         # Determine optimal pool size based on workload type
         if pool_size is None:
             max_connections_override = None
@@ -766,6 +813,57 @@ class PostgresDatabase:
             print_error(f"Failed to insert comment {comment.get('id', 'unknown')}: {e}")
             return False
 
+    @property
+    def _transaction_connection(self):
+        """Connection of the currently active transaction() block, if any."""
+        return getattr(self._txn_local, "conn", None)
+
+    @contextmanager
+    def transaction(self):
+        """Run multiple batch operations inside a single transaction.
+
+        Batch insert methods called inside this block share one connection and
+        skip their internal per-batch COMMIT, so a combined posts+comments
+        import pays a single WAL fsync at block exit instead of one per call.
+
+        Example:
+            with db.transaction():
+                db.insert_posts_batch(posts)
+                db.insert_comments_batch(comments)
+
+        Yields:
+            psycopg.Connection: The shared transaction connection
+        """
+        if self._transaction_connection is not None:
+            # Nested transaction() blocks join the outer transaction
+            yield self._transaction_connection
+            return
+
+        with self.pool.get_connection() as conn:
+            self._txn_local.conn = conn
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self._txn_local.conn = None
+
+    @contextmanager
+    def _batch_connection(self):
+        """Yield the active transaction() connection, or one from the pool.
+
+        Yields:
+            psycopg.Connection: Database connection
+        """
+        conn = self._transaction_connection
+        if conn is not None:
+            yield conn
+        else:
+            with self.pool.get_connection() as conn:
+                yield conn
+
     @retry_with_exponential_backoff(max_retries=5, initial_delay=2.0, max_delay=60.0)
     def insert_posts_batch(
         self,
@@ -801,7 +899,7 @@ class PostgresDatabase:
         start_time = time.time()
 
         try:
-            with self.pool.get_connection() as conn:
+            with self._batch_connection() as conn:
                 # Disable synchronous_commit for bulk insert performance (10-20% faster)
                 # Transaction safety is maintained - rollback still works correctly
                 with conn.cursor() as cur:
@@ -872,27 +970,10 @@ class PostgresDatabase:
                                 # Create temporary table for upsert pattern (optimal for transaction-scoped staging)
                                 # TEMPORARY tables are session-scoped and support ON COMMIT DROP for automatic cleanup
                                 # Only include columns we're populating (excludes auto-generated created_at)
-                                cur.execute("""
-                                    CREATE TEMPORARY TABLE posts_staging (
-                                        id TEXT PRIMARY KEY,
-                                        subreddit TEXT NOT NULL,
-                                        author TEXT NOT NULL,
-                                        title TEXT NOT NULL,
-                                        selftext TEXT,
-                                        url TEXT,
-                                        domain TEXT,
-                                        permalink TEXT NOT NULL,
-                                        created_utc BIGINT NOT NULL,
-                                        score INTEGER DEFAULT 0,
-                                        num_comments INTEGER DEFAULT 0,
-                                        is_self BOOLEAN DEFAULT false,
-                                        over_18 BOOLEAN DEFAULT false,
-                                        locked BOOLEAN DEFAULT false,
-                                        stickied BOOLEAN DEFAULT false,
-                                        platform TEXT DEFAULT 'reddit' NOT NULL,
-                                        json_data JSONB NOT NULL
-                                    ) ON COMMIT DROP
-                                """)
+                                # Inside a transaction() block the ON COMMIT DROP cleanup is
+                                # deferred, so drop any staging table from a previous batch
+                                cur.execute("DROP TABLE IF EXISTS posts_staging")
+                                cur.execute(POSTS_STAGING_DDL)
 
                                 # COPY streams data directly without buffering
                                 with cur.copy(
@@ -915,10 +996,15 @@ class PostgresDatabase:
                                         num_comments = EXCLUDED.num_comments,
                                         json_data = EXCLUDED.json_data
                                 """)
-                            conn.commit()
+                            if self._transaction_connection is None:
+                                conn.commit()
                             successful += records_prepared
 
                     except Exception as e:
+                        if self._transaction_connection is not None:
+                            # Inside an outer transaction(): don't roll back prior
+                            # work mid-stream, let transaction() handle it
+                            raise
                         conn.rollback()
                         print_error(f"Batch insert failed for posts {batch_start}-{batch_start + batch_size}: {e}")
                         failed += batch_size
@@ -993,7 +1079,7 @@ class PostgresDatabase:
         start_time = time.time()
 
         try:
-            with self.pool.get_connection() as conn:
+            with self._batch_connection() as conn:
                 # Disable synchronous_commit for bulk insert performance (10-20% faster)
                 # Transaction safety is maintained - rollback still works correctly
                 with conn.cursor() as cur:
@@ -1095,23 +1181,10 @@ class PostgresDatabase:
                                 # Create temporary table for upsert pattern (optimal for transaction-scoped staging)
                                 # TEMPORARY tables are session-scoped and support ON COMMIT DROP for automatic cleanup
                                 # Only include columns we're populating (excludes auto-generated created_at)
-                                cur.execute("""
-                                    CREATE TEMPORARY TABLE comments_staging (
-                                        id TEXT PRIMARY KEY,
-                                        post_id TEXT NOT NULL,
-                                        parent_id TEXT,
-                                        subreddit TEXT NOT NULL,
-                                        author TEXT NOT NULL,
-                                        body TEXT NOT NULL,
-                                        permalink TEXT NOT NULL,
-                                        link_id TEXT,
-                                        created_utc BIGINT NOT NULL,
-                                        score INTEGER DEFAULT 0,
-                                        depth INTEGER DEFAULT 0,
-                                        platform TEXT DEFAULT 'reddit' NOT NULL,
-                                        json_data JSONB NOT NULL
-                                    ) ON COMMIT DROP
-                                """)
+                                # Inside a transaction() block the ON COMMIT DROP cleanup is
+                                # deferred, so drop any staging table from a previous batch
+                                cur.execute("DROP TABLE IF EXISTS comments_staging")
+                                cur.execute(COMMENTS_STAGING_DDL)
 
                                 # COPY streams data directly without buffering
                                 with cur.copy(
@@ -1131,10 +1204,15 @@ class PostgresDatabase:
                                         score = EXCLUDED.score,
                                         json_data = EXCLUDED.json_data
                                 """)
-                            conn.commit()
+                            if self._transaction_connection is None:
+                                conn.commit()
                             successful += records_prepared
 
                     except Exception as e:
+                        if self._transaction_connection is not None:
+                            # Inside an outer transaction(): don't roll back prior
+                            # work mid-stream, let transaction() handle it
+                            raise
                         conn.rollback()
                         error_msg = str(e)
                         print_error(
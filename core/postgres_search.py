@@ -6,13 +6,14 @@ from dataclasses import dataclass
 from typing import Any
 
 from psycopg import sql
+from psycopg.rows import tuple_row
 
 from utils.console_output import print_error, print_info
 
 from .postgres_database import PostgresDatabase, get_postgres_connection_string
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Single search result from posts or comments."""
 
@@ -41,8 +42,46 @@ class SearchResult:
     headline: str | None = None  # Highlighted excerpt
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        """Convert to dictionary for JSON serialization.
+
+        Hand-rolled with explicit field access (no dataclasses.asdict or
+        __dict__ walk) so serializing large result sets stays cheap.
+        Only the fields relevant to the result type are considered.
+        """
+        if self.result_type == "post":
+            d = {
+                "result_type": self.result_type,
+                "id": self.id,
+                "subreddit": self.subreddit,
+                "platform": self.platform,
+                "author": self.author,
+                "created_utc": self.created_utc,
+                "score": self.score,
+                "title": self.title,
+                "selftext": self.selftext,
+                "num_comments": self.num_comments,
+                "url": self.url,
+                "permalink": self.permalink,
+                "rank": self.rank,
+                "headline": self.headline,
+            }
+        else:
+            d = {
+                "result_type": self.result_type,
+                "id": self.id,
+                "subreddit": self.subreddit,
+                "platform": self.platform,
+                "author": self.author,
+                "created_utc": self.created_utc,
+                "score": self.score,
+                "permalink": self.permalink,
+                "body": self.body,
+                "post_id": self.post_id,
+                "post_title": self.post_title,
+                "rank": self.rank,
+                "headline": self.headline,
+            }
+        return {k: v for k, v in d.items() if v is not None}
 
 
 @dataclass
@@ -61,6 +100,18 @@ class SearchQuery:
     order_by: str = "rank"  # 'rank', 'score', 'created_utc'
 
 
+# Precomputed ORDER BY fragments, keyed by SearchQuery.order_by.
+# Module-level so every search() shares the same interned strings
+# instead of rebuilding the mapping per call.
+_ORDER_BY_CLAUSES = {
+    "rank": "rank DESC, score DESC, created_utc DESC",
+    "score": "score DESC, rank DESC, created_utc DESC",
+    "created_utc": "created_utc DESC, rank DESC, score DESC",
+    "date": "created_utc DESC, rank DESC, score DESC",
+    "created_utc_asc": "created_utc ASC, rank DESC, score DESC",
+}
+
+
 class PostgresSearch:
     """
     Unified full-text search for Reddit posts and comments using PostgreSQL.
@@ -95,9 +146,17 @@ class PostgresSearch:
         Returns:
             Tuple of (results list, total_count)
         """
-        if not query.query_text or query.query_text.strip() == "":
+        # Degenerate queries short-circuit before any pool acquisition:
+        # no connection, no SQL parse, no wire traffic
+        stripped = query.query_text.strip() if query.query_text else ""
+        if not stripped:
             return [], 0
 
+        # "*" is the match-all sentinel: skip full-text machinery entirely
+        # and run a plain filter query that can use btree indexes
+        if stripped == "*":
+            return self._search_no_text(query)
+
         results = []
 
         # Determine which tables to search
@@ -168,9 +227,12 @@ class PostgresSearch:
                     """).format(union_query=union_query)
 
                     # Use same params but without limit/offset
+                    # COUNT(*) only needs positional access - use a tuple-row
+                    # cursor to skip the per-row dict allocation
                     count_params = query_params[:-2]
-                    cur.execute(count_query, count_params)
-                    total_count = cur.fetchone()["count"]
+                    with conn.cursor(row_factory=tuple_row) as count_cur:
+                        count_cur.execute(count_query, count_params)
+                        total_count = count_cur.fetchone()[0]
 
                     return results, total_count
 
@@ -178,6 +240,203 @@ class PostgresSearch:
                     print_error(f"Search query failed: {e}")
                     return [], 0
 
+    def _search_no_text(self, query: SearchQuery) -> tuple[list[SearchResult], int]:
+        """Execute filter-only search without full-text matching.
+
+        Used for the "*" match-all sentinel: emits SQL without
+        websearch_to_tsquery, ts_rank or ts_headline so PostgreSQL can
+        satisfy the query from plain btree indexes (subreddit/author +
+        created_utc) instead of evaluating the tsvector GIN index.
+
+        Args:
+            query: Search query parameters (query_text is ignored)
+
+        Returns:
+            Tuple of (results list, total_count)
+        """
+        results = []
+
+        search_posts = query.result_type in (None, "post")
+        search_comments = query.result_type in (None, "comment")
+
+        with self.db.pool.get_connection() as conn:
+            with conn.cursor() as cur:
+                union_parts = []
+                query_params = []
+
+                if search_posts:
+                    posts_query, posts_params = self._build_posts_filter_query(query)
+                    union_parts.append(posts_query)
+                    query_params.extend(posts_params)
+
+                if search_comments:
+                    comments_query, comments_params = self._build_comments_filter_query(query)
+                    union_parts.append(comments_query)
+                    query_params.extend(comments_params)
+
+                if not union_parts:
+                    return [], 0
+
+                union_query = sql.SQL(" UNION ALL ").join(union_parts)
+
+                # rank is NULL for every row here, so the rank ordering
+                # falls through to the score/created_utc tiebreakers
+                combined_query = sql.SQL("""
+                WITH combined_results AS (
+                    {union_query}
+                )
+                SELECT * FROM combined_results
+                ORDER BY {order_by}
+                LIMIT {limit_placeholder} OFFSET {offset_placeholder}
+                """).format(
+                    union_query=union_query,
+                    order_by=sql.SQL(self._get_order_by_clause(query.order_by)),
+                    limit_placeholder=sql.Placeholder(),
+                    offset_placeholder=sql.Placeholder(),
+                )
+
+                query_params.extend([query.limit, query.offset])
+
+                try:
+                    cur.execute(combined_query, query_params)
+                    rows = cur.fetchall()
+
+                    for row in rows:
+                        result = self._parse_search_result(row)
+                        if result:
+                            results.append(result)
+
+                    count_query = sql.SQL("""
+                    SELECT COUNT(*) as count FROM (
+                        {union_query}
+                    ) AS count_query
+                    """).format(union_query=union_query)
+
+                    # COUNT(*) only needs positional access - use a tuple-row
+                    # cursor to skip the per-row dict allocation
+                    count_params = query_params[:-2]
+                    with conn.cursor(row_factory=tuple_row) as count_cur:
+                        count_cur.execute(count_query, count_params)
+                        total_count = count_cur.fetchone()[0]
+
+                    return results, total_count
+
+                except Exception as e:
+                    print_error(f"Search query failed: {e}")
+                    return [], 0
+
+    def _build_filter_clauses(self, query: SearchQuery, table: str | None = None) -> tuple[sql.Composable, list]:
+        """Build WHERE clause from SearchQuery filters (no full-text clause).
+
+        Args:
+            query: Search parameters
+            table: Optional table prefix for column references
+
+        Returns:
+            Tuple of (SQL Composable WHERE clause, parameters list)
+        """
+        prefix = f"{table}." if table else ""
+        where_clauses = []
+        params = []
+
+        if query.subreddit:
+            where_clauses.append(sql.SQL(f"LOWER({prefix}subreddit) = LOWER({{}})").format(sql.Placeholder()))
+            params.append(query.subreddit)
+
+        if query.author:
+            where_clauses.append(sql.SQL(f"{prefix}author = {{}}").format(sql.Placeholder()))
+            params.append(query.author)
+
+        if query.min_score > 0:
+            where_clauses.append(sql.SQL(f"{prefix}score >= {{}}").format(sql.Placeholder()))
+            params.append(query.min_score)
+
+        if query.start_date:
+            where_clauses.append(sql.SQL(f"{prefix}created_utc >= {{}}").format(sql.Placeholder()))
+            params.append(query.start_date)
+
+        if query.end_date:
+            where_clauses.append(sql.SQL(f"{prefix}created_utc <= {{}}").format(sql.Placeholder()))
+            params.append(query.end_date)
+
+        if not where_clauses:
+            return sql.SQL("TRUE"), params
+
+        return sql.SQL(" AND ").join(where_clauses), params
+
+    def _build_posts_filter_query(self, query: SearchQuery) -> tuple[sql.Composable, list]:
+        """Build filter-only posts query (no tsquery, no ranking).
+
+        Args:
+            query: Search parameters
+
+        Returns:
+            Tuple of (SQL Composable query, parameters list)
+        """
+        where_clause, params = self._build_filter_clauses(query)
+
+        posts_query = sql.SQL("""
+        SELECT
+            'post' as result_type,
+            id,
+            subreddit,
+            platform,
+            author,
+            created_utc,
+            score,
+            title,
+            selftext,
+            num_comments,
+            url,
+            permalink,
+            NULL::text as body,
+            NULL::text as post_id,
+            NULL::text as post_title,
+            NULL::real as rank,
+            NULL::text as headline
+        FROM posts
+        WHERE {where_clause}
+        """).format(where_clause=where_clause)
+
+        return posts_query, params
+
+    def _build_comments_filter_query(self, query: SearchQuery) -> tuple[sql.Composable, list]:
+        """Build filter-only comments query (no tsquery, no ranking).
+
+        Args:
+            query: Search parameters
+
+        Returns:
+            Tuple of (SQL Composable query, parameters list)
+        """
+        where_clause, params = self._build_filter_clauses(query, table="comments")
+
+        comments_query = sql.SQL("""
+        SELECT
+            'comment' as result_type,
+            comments.id,
+            comments.subreddit,
+            comments.platform,
+            comments.author,
+            comments.created_utc,
+            comments.score,
+            NULL::text as title,
+            NULL::text as selftext,
+            NULL::integer as num_comments,
+            NULL::text as url,
+            comments.permalink,
+            comments.body,
+            comments.post_id,
+            posts.title as post_title,
+            NULL::real as rank,
+            NULL::text as headline
+        FROM comments
+        LEFT JOIN posts ON comments.post_id = posts.id
+        WHERE {where_clause}
+        """).format(where_clause=where_clause)
+
+        return comments_query, params
+
     def _prepare_tsquery(self, query_text: str) -> str:
         """Prepare search query text for PostgreSQL tsquery.
 
@@ -375,15 +634,7 @@ class PostgresSearch:
         Returns:
             SQL ORDER BY clause
         """
-        order_clauses = {
-            "rank": "rank DESC, score DESC, created_utc DESC",
-            "score": "score DESC, rank DESC, created_utc DESC",
-            "created_utc": "created_utc DESC, rank DESC, score DESC",
-            "date": "created_utc DESC, rank DESC, score DESC",
-            "created_utc_asc": "created_utc ASC, rank DESC, score DESC",
-        }
-
-        return order_clauses.get(order_by, order_clauses["rank"])
+        return _ORDER_BY_CLAUSES.get(order_by, _ORDER_BY_CLAUSES["rank"])
 
     def _parse_search_result(self, row: tuple) -> SearchResult | None:
         """Parse database row into SearchResult object.
@@ -43,6 +43,19 @@ def temp_data_dir():
         yield tmpdir
 
 
+@pytest.fixture(scope="session")
+def test_prefix():
+    """Test-data name prefix, unique per pytest-xdist worker.
+
+    Database tests namespace their subreddits/authors with this prefix so
+    `pytest -n N` can run them concurrently against a shared database
+    without cross-worker interference. Without xdist this is plain
+    "test_", preserving the existing naming.
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    return f"test_{worker_id}_" if worker_id else "test_"
+
+
 @pytest.fixture(scope="session")
 def postgres_connection_string():
     """Get PostgreSQL connection string for tests"""
@@ -406,6 +419,10 @@ def multiplatform_test_database(postgres_db):
     # Update user statistics to populate the users table
     postgres_db.update_user_statistics()
 
+    # Refresh planner statistics after bulk setup so the query planner
+    # picks index scans on the small test tables instead of seq scans
+    postgres_db.analyze_tables(["posts", "comments", "users"])
+
     # Calculate and save subreddit statistics for the stats endpoint
     for community in ["banned", "RedditCensors", "videos", "Quarantine"]:
         stats = postgres_db.calculate_subreddit_statistics(community)
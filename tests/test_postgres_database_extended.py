@@ -5,6 +5,7 @@ ABOUTME: Tests COPY protocol inserts, duplicate handling, and index lifecycle op
 """
 
 import pytest
+from psycopg.rows import tuple_row
 
 # =============================================================================
 # BULK INSERT TESTS
@@ -54,9 +55,9 @@ class TestBulkInsertPosts:
 
         # Verify data was inserted
         with postgres_db.pool.get_connection() as conn:
-            with conn.cursor() as cur:
+            with conn.cursor(row_factory=tuple_row) as cur:
                 cur.execute("SELECT COUNT(*) FROM posts WHERE subreddit = 'test_bulk'")
-                count = cur.fetchone()["count"]
+                count = cur.fetchone()[0]
                 assert count == 2
 
         # Cleanup
@@ -108,9 +109,9 @@ class TestBulkInsertPosts:
 
         # Verify only one record exists
         with postgres_db.pool.get_connection() as conn:
-            with conn.cursor() as cur:
+            with conn.cursor(row_factory=tuple_row) as cur:
                 cur.execute("SELECT COUNT(*) FROM posts WHERE id = 'dup_post_1'")
-                count = cur.fetchone()["count"]
+                count = cur.fetchone()[0]
                 assert count == 1
 
         # Cleanup
@@ -208,9 +209,9 @@ class TestBulkInsertComments:
 
         # Verify data was inserted
         with postgres_db.pool.get_connection() as conn:
-            with conn.cursor() as cur:
+            with conn.cursor(row_factory=tuple_row) as cur:
                 cur.execute("SELECT COUNT(*) FROM comments WHERE subreddit = 'test_bulk_c'")
-                count = cur.fetchone()["count"]
+                count = cur.fetchone()[0]
                 assert count == 2
 
         # Cleanup
@@ -368,13 +369,17 @@ class TestLargeBatches:
 
     def test_insert_large_post_batch(self, postgres_db):
         """Test insertion of larger batch (100 posts)."""
+        # Precompute the cycled author names once instead of re-formatting
+        # the same 10 strings in every iteration
+        authors = [f"author_{j}" for j in range(10)]
+
         posts = []
         for i in range(100):
             posts.append(
                 {
                     "id": f"large_batch_{i}",
                     "subreddit": "test_large_batch",
-                    "author": f"author_{i % 10}",
+                    "author": authors[i % 10],
                     "title": f"Post {i}",
                     "selftext": f"Content for post {i}",
                     "created_utc": 1640000000 + i * 100,
@@ -393,9 +398,9 @@ class TestLargeBatches:
 
         # Verify count
         with postgres_db.pool.get_connection() as conn:
-            with conn.cursor() as cur:
+            with conn.cursor(row_factory=tuple_row) as cur:
                 cur.execute("SELECT COUNT(*) FROM posts WHERE subreddit = 'test_large_batch'")
-                count = cur.fetchone()["count"]
+                count = cur.fetchone()[0]
                 assert count == 100
 
         # Cleanup
@@ -407,41 +412,50 @@ class TestLargeBatches:
     def test_insert_large_comment_batch(self, postgres_db):
         """Test insertion of larger batch (100 comments)."""
         # First insert parent posts (foreign key requirement)
+        # Precompute the 10 cycled parent/author strings once instead of
+        # re-evaluating identical f-strings in every loop iteration
+        parents = [f"large_comment_parent_{j}" for j in range(10)]
+        link_ids = [f"t3_{p}" for p in parents]
+        commenters = [f"commenter_{j}" for j in range(10)]
+
         parent_posts = []
         for i in range(10):
             parent_posts.append(
                 {
-                    "id": f"large_comment_parent_{i}",
+                    "id": parents[i],
                     "subreddit": "test_large_comments",
                     "author": f"author_{i}",
                     "title": f"Parent Post {i}",
                     "created_utc": 1640000000 + i * 1000,
                     "score": 100,
-                    "permalink": f"/r/test_large_comments/comments/large_comment_parent_{i}/",
+                    "permalink": f"/r/test_large_comments/comments/{parents[i]}/",
                     "platform": "reddit",
                 }
             )
-        postgres_db.insert_posts_batch(parent_posts)
-
         comments = []
         for i in range(100):
+            parent = parents[i % 10]
             comments.append(
                 {
                     "id": f"large_comment_{i}",
                     "subreddit": "test_large_comments",
-                    "author": f"commenter_{i % 10}",
+                    "author": commenters[i % 10],
                     "body": f"Comment body {i}",
                     "created_utc": 1640000000 + i * 100,
                     "score": i * 5,
-                    "post_id": f"large_comment_parent_{i % 10}",
-                    "link_id": f"t3_large_comment_parent_{i % 10}",
-                    "parent_id": f"t3_large_comment_parent_{i % 10}",
-                    "permalink": f"/r/test_large_comments/comments/large_comment_parent_{i % 10}/_/large_comment_{i}/",
+                    "post_id": parent,
+                    "link_id": link_ids[i % 10],
+                    "parent_id": link_ids[i % 10],
+                    "permalink": f"/r/test_large_comments/comments/{parent}/_/large_comment_{i}/",
                     "platform": "reddit",
                 }
             )
 
-        successful, failed = postgres_db.insert_comments_batch(comments)
+        # One transaction around both batches: a single COMMIT fsync
+        # instead of one per insert call
+        with postgres_db.transaction():
+            postgres_db.insert_posts_batch(parent_posts)
+            successful, failed = postgres_db.insert_comments_batch(comments)
 
         assert successful == 100
         assert failed == 0
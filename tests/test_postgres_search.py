@@ -147,16 +147,22 @@ class TestPostgresSearchIntegration:
     """Integration tests for PostgresSearch (requires database)."""
 
     @pytest.fixture(autouse=True)
-    def setup_search(self, postgres_db):
+    def setup_search(self, postgres_db, test_prefix):
         """Setup search instance and test data."""
         self.db = postgres_db
         self.search = PostgresSearch()
 
+        # Namespace test data per xdist worker so `pytest -n N` can run
+        # these db tests concurrently without cross-worker interference
+        self.prefix = test_prefix
+        self.subreddit = f"{test_prefix}search"
+        self.other_subreddit = f"{test_prefix}other"
+
         # Insert test data for search tests
         test_posts = [
             {
-                "id": "search_test_1",
-                "subreddit": "test_search",
+                "id": f"{self.prefix}post_1",
+                "subreddit": self.subreddit,
                 "author": "test_author_1",
                 "title": "Technology and Programming Tutorial",
                 "selftext": "Learn about Python programming and web development",
@@ -164,12 +170,12 @@ class TestPostgresSearchIntegration:
                 "score": 100,
                 "num_comments": 10,
                 "url": "https://example.com/1",
-                "permalink": "/r/test_search/comments/search_test_1/",
+                "permalink": f"/r/{self.subreddit}/comments/{self.prefix}post_1/",
                 "platform": "reddit",
             },
             {
-                "id": "search_test_2",
-                "subreddit": "test_search",
+                "id": f"{self.prefix}post_2",
+                "subreddit": self.subreddit,
                 "author": "test_author_2",
                 "title": "Security Best Practices",
                 "selftext": "How to secure your applications and data",
@@ -177,12 +183,12 @@ class TestPostgresSearchIntegration:
                 "score": 50,
                 "num_comments": 5,
                 "url": "https://example.com/2",
-                "permalink": "/r/test_search/comments/search_test_2/",
+                "permalink": f"/r/{self.subreddit}/comments/{self.prefix}post_2/",
                 "platform": "reddit",
             },
             {
-                "id": "search_test_3",
-                "subreddit": "test_other",
+                "id": f"{self.prefix}post_3",
+                "subreddit": self.other_subreddit,
                 "author": "test_author_1",
                 "title": "Another Topic Entirely",
                 "selftext": "This post is in a different subreddit",
@@ -190,36 +196,36 @@ class TestPostgresSearchIntegration:
                 "score": 25,
                 "num_comments": 2,
                 "url": "https://example.com/3",
-                "permalink": "/r/test_other/comments/search_test_3/",
+                "permalink": f"/r/{self.other_subreddit}/comments/{self.prefix}post_3/",
                 "platform": "reddit",
             },
         ]
 
         test_comments = [
             {
-                "id": "search_comment_1",
-                "subreddit": "test_search",
+                "id": f"{self.prefix}comment_1",
+                "subreddit": self.subreddit,
                 "author": "commenter_1",
                 "body": "Great tutorial on programming!",
                 "created_utc": 1640000100,
                 "score": 20,
-                "post_id": "search_test_1",
-                "link_id": "t3_search_test_1",
-                "parent_id": "t3_search_test_1",
-                "permalink": "/r/test_search/comments/search_test_1/_/search_comment_1/",
+                "post_id": f"{self.prefix}post_1",
+                "link_id": f"t3_{self.prefix}post_1",
+                "parent_id": f"t3_{self.prefix}post_1",
+                "permalink": f"/r/{self.subreddit}/comments/{self.prefix}post_1/_/{self.prefix}comment_1/",
                 "platform": "reddit",
             },
             {
-                "id": "search_comment_2",
-                "subreddit": "test_search",
+                "id": f"{self.prefix}comment_2",
+                "subreddit": self.subreddit,
                 "author": "commenter_2",
                 "body": "Security is very important",
                 "created_utc": 1640001100,
                 "score": 15,
-                "post_id": "search_test_2",
-                "link_id": "t3_search_test_2",
-                "parent_id": "t3_search_test_2",
-                "permalink": "/r/test_search/comments/search_test_2/_/search_comment_2/",
+                "post_id": f"{self.prefix}post_2",
+                "link_id": f"t3_{self.prefix}post_2",
+                "parent_id": f"t3_{self.prefix}post_2",
+                "permalink": f"/r/{self.subreddit}/comments/{self.prefix}post_2/_/{self.prefix}comment_2/",
                 "platform": "reddit",
             },
         ]
@@ -227,13 +233,17 @@ class TestPostgresSearchIntegration:
         self.db.insert_posts_batch(test_posts)
         self.db.insert_comments_batch(test_comments)
 
+        # Refresh planner statistics so the tiny test tables still exercise
+        # the GIN/btree indexes instead of falling back to seq scans
+        self.db.analyze_tables(["posts", "comments"])
+
         yield
 
         # Cleanup
         with self.db.pool.get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute("DELETE FROM comments WHERE subreddit LIKE 'test_%'")
-                cur.execute("DELETE FROM posts WHERE subreddit LIKE 'test_%'")
+                cur.execute("DELETE FROM comments WHERE subreddit LIKE %s", (f"{self.prefix}%",))
+                cur.execute("DELETE FROM posts WHERE subreddit LIKE %s", (f"{self.prefix}%",))
                 conn.commit()
 
         self.search.cleanup()
@@ -281,10 +291,10 @@ class TestPostgresSearchIntegration:
 
     def test_search_with_subreddit_filter(self):
         """Test search filtered by subreddit."""
-        query = SearchQuery(query_text="*", subreddit="test_search")
+        query = SearchQuery(query_text="*", subreddit=self.subreddit)
         results, count = self.search.search(query)
 
-        assert all(r.subreddit == "test_search" for r in results)
+        assert all(r.subreddit == self.subreddit for r in results)
 
     def test_search_with_author_filter(self):
         """Test search filtered by author."""
@@ -365,16 +375,17 @@ class TestSearchConvenienceMethods:
     """Tests for PostgresSearch convenience methods."""
 
     @pytest.fixture(autouse=True)
-    def setup_search(self, postgres_db):
+    def setup_search(self, postgres_db, test_prefix):
         """Setup search instance and test data."""
         self.db = postgres_db
         self.search = PostgresSearch()
+        self.subreddit = f"{test_prefix}convenience"
 
         # Insert minimal test data
         test_posts = [
             {
-                "id": "conv_test_1",
-                "subreddit": "test_convenience",
+                "id": f"{test_prefix}conv_1",
+                "subreddit": self.subreddit,
                 "author": "conv_author",
                 "title": "Convenience Test Post",
                 "selftext": "Test content for convenience methods",
@@ -382,30 +393,31 @@ class TestSearchConvenienceMethods:
                 "score": 100,
                 "num_comments": 5,
                 "url": "https://example.com",
-                "permalink": "/r/test_convenience/comments/conv_test_1/",
+                "permalink": f"/r/{self.subreddit}/comments/{test_prefix}conv_1/",
                 "platform": "reddit",
             }
         ]
 
         self.db.insert_posts_batch(test_posts)
+        self.db.analyze_tables(["posts"])
 
         yield
 
         # Cleanup
         with self.db.pool.get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute("DELETE FROM posts WHERE subreddit = 'test_convenience'")
+                cur.execute("DELETE FROM posts WHERE subreddit = %s", (self.subreddit,))
                 conn.commit()
 
         self.search.cleanup()
 
     def test_search_subreddit_convenience(self):
         """Test search_subreddit convenience method."""
-        results = self.search.search_subreddit("test_convenience", "*")
+        results = self.search.search_subreddit(self.subreddit, "*")
 
         assert isinstance(results, list)
         if results:
-            assert all(r.subreddit == "test_convenience" for r in results)
+            assert all(r.subreddit == self.subreddit for r in results)
 
     def test_search_author_convenience(self):
         """Test search_author convenience method."""
@@ -429,7 +441,7 @@ class TestSearchConvenienceMethods:
 
     def test_get_trending_searches_with_subreddit(self):
         """Test get_trending_searches with subreddit filter."""
-        trending = self.search.get_trending_searches(subreddit="test_convenience")
+        trending = self.search.get_trending_searches(subreddit=self.subreddit)
 
         assert isinstance(trending, list)
 
@@ -444,14 +456,15 @@ class TestBackwardsCompatibility:
     """Tests for backwards compatibility functions."""
 
     @pytest.fixture(autouse=True)
-    def setup(self, postgres_db):
+    def setup(self, postgres_db, test_prefix):
         """Setup test data."""
         self.db = postgres_db
+        self.subreddit = f"{test_prefix}compat"
 
         test_posts = [
             {
-                "id": "compat_test_1",
-                "subreddit": "test_compat",
+                "id": f"{test_prefix}compat_1",
+                "subreddit": self.subreddit,
                 "author": "compat_author",
                 "title": "Compatibility Test",
                 "selftext": "Testing backwards compatibility",
@@ -459,7 +472,7 @@ class TestBackwardsCompatibility:
                 "score": 50,
                 "num_comments": 3,
                 "url": "https://example.com",
-                "permalink": "/r/test_compat/comments/compat_test_1/",
+                "permalink": f"/r/{self.subreddit}/comments/{test_prefix}compat_1/",
                 "platform": "reddit",
             }
         ]
@@ -471,18 +484,18 @@ class TestBackwardsCompatibility:
         # Cleanup
         with self.db.pool.get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute("DELETE FROM posts WHERE subreddit = 'test_compat'")
+                cur.execute("DELETE FROM posts WHERE subreddit = %s", (self.subreddit,))
                 conn.commit()
 
     def test_search_archive_function(self):
         """Test search_archive backwards compatibility function."""
-        results = search_archive("compatibility", subreddit="test_compat")
+        results = search_archive("compatibility", subreddit=self.subreddit)
 
         assert isinstance(results, list)
 
     def test_generate_search_index_noop(self):
         """Test generate_search_index_for_subreddit is no-op (always succeeds)."""
-        result = generate_search_index_for_subreddit("test_compat", "/tmp/output")  # noqa: S108
+        result = generate_search_index_for_subreddit(self.subreddit, "/tmp/output")  # noqa: S108
 
         # Should always return True (no-op for PostgreSQL)
         assert result is True
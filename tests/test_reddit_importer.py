@@ -4,8 +4,9 @@ ABOUTME: Unit tests for Reddit .zst archive importer
 ABOUTME: Tests file detection, post/comment streaming, and field normalization
 """
 
-import json
+from itertools import islice
 
+import orjson
 import pytest
 import zstandard
 
@@ -22,9 +23,26 @@ def reddit_importer():
     return RedditImporter()
 
 
-@pytest.fixture
-def sample_posts_zst(tmp_path):
-    """Create a sample Reddit posts .zst file."""
+@pytest.fixture(scope="session")
+def zstd_compressor():
+    """Shared ZstdCompressor - construction allocates a ~1MB context, and
+    the compressor object is safely reusable across compress() calls."""
+    return zstandard.ZstdCompressor()
+
+
+@pytest.fixture(scope="session")
+def sample_archive_dir(tmp_path_factory, zstd_compressor):
+    """Directory holding the sample posts and comments .zst archives.
+
+    Session-scoped: the JSONL payloads are compressed once and shared by
+    every streaming test, which only ever reads them.
+    """
+    archive_dir = tmp_path_factory.mktemp("reddit_samples")
+
+    # Minimal record set covering every streaming assertion: one technology
+    # post (content preservation + filter hit), one privacy post (filter
+    # miss), one top-level comment and one reply. Optional fields no test
+    # asserts on are omitted - the importer fills their defaults.
     posts = [
         {
             "id": "abc123",
@@ -32,19 +50,9 @@ def sample_posts_zst(tmp_path):
             "author": "testuser",
             "title": "Test Post Title",
             "selftext": "This is the post content",
-            "url": "https://example.com",
-            "domain": "example.com",
             "permalink": "/r/technology/comments/abc123/test_post_title/",
             "created_utc": 1640000000,
             "score": 100,
-            "ups": 120,
-            "downs": 20,
-            "num_comments": 50,
-            "is_self": True,
-            "over_18": False,
-            "locked": False,
-            "stickied": False,
-            "archived": False,
         },
         {
             "id": "def456",
@@ -52,36 +60,12 @@ def sample_posts_zst(tmp_path):
             "author": "another_user",
             "title": "Privacy Discussion",
             "selftext": "Discussion about privacy",
-            "url": "https://self.reddit.com",
-            "domain": "self.privacy",
             "permalink": "/r/privacy/comments/def456/privacy_discussion/",
             "created_utc": 1640001000,
             "score": 50,
-            "ups": 60,
-            "downs": 10,
-            "num_comments": 25,
-            "is_self": True,
-            "over_18": False,
-            "locked": False,
-            "stickied": False,
-            "archived": False,
         },
     ]
 
-    content = "\n".join(json.dumps(post) for post in posts)
-    zst_path = tmp_path / "technology_submissions.zst"
-    compressor = zstandard.ZstdCompressor()
-    compressed = compressor.compress(content.encode("utf-8"))
-
-    with open(zst_path, "wb") as f:
-        f.write(compressed)
-
-    return str(zst_path)
-
-
-@pytest.fixture
-def sample_comments_zst(tmp_path):
-    """Create a sample Reddit comments .zst file."""
     comments = [
         {
             "id": "xyz789",
@@ -93,9 +77,6 @@ def sample_comments_zst(tmp_path):
             "permalink": "/r/technology/comments/abc123/_/xyz789/",
             "created_utc": 1640000100,
             "score": 20,
-            "ups": 25,
-            "downs": 5,
-            "depth": 0,
         },
         {
             "id": "uvw012",
@@ -107,27 +88,34 @@ def sample_comments_zst(tmp_path):
             "permalink": "/r/technology/comments/abc123/_/uvw012/",
             "created_utc": 1640000200,
             "score": 10,
-            "ups": 12,
-            "downs": 2,
-            "depth": 1,
         },
     ]
 
-    content = "\n".join(json.dumps(comment) for comment in comments)
-    zst_path = tmp_path / "technology_comments.zst"
-    compressor = zstandard.ZstdCompressor()
-    compressed = compressor.compress(content.encode("utf-8"))
+    # orjson.dumps returns bytes, so no separate utf-8 encode pass is needed
+    for filename, records in (("technology_submissions.zst", posts), ("technology_comments.zst", comments)):
+        content = b"\n".join(orjson.dumps(record) for record in records)
+        with open(archive_dir / filename, "wb") as f:
+            f.write(zstd_compressor.compress(content))
 
-    with open(zst_path, "wb") as f:
-        f.write(compressed)
+    return archive_dir
 
-    return str(zst_path)
 
+@pytest.fixture(scope="session")
+def sample_posts_zst(sample_archive_dir):
+    """Path to the sample Reddit posts .zst file."""
+    return str(sample_archive_dir / "technology_submissions.zst")
+
+
+@pytest.fixture(scope="session")
+def sample_comments_zst(sample_archive_dir):
+    """Path to the sample Reddit comments .zst file."""
+    return str(sample_archive_dir / "technology_comments.zst")
 
-@pytest.fixture
-def sample_input_dir(tmp_path, sample_posts_zst, sample_comments_zst):
-    """Create a directory with both posts and comments files."""
-    return str(tmp_path)
+
+@pytest.fixture(scope="session")
+def sample_input_dir(sample_archive_dir):
+    """Directory with both posts and comments files."""
+    return str(sample_archive_dir)
 
 
 # =============================================================================
@@ -203,16 +191,15 @@ class TestStreamPosts:
 
     def test_stream_posts_basic(self, reddit_importer, sample_posts_zst):
         """Test basic post streaming."""
-        posts = list(reddit_importer.stream_posts(sample_posts_zst))
+        # Pull a single record: proves streaming works without draining
+        # (and that stream_posts really is a generator)
+        first = next(reddit_importer.stream_posts(sample_posts_zst), None)
 
-        # At least 1 post should be streamed
-        assert len(posts) >= 1
+        assert first is not None
 
     def test_stream_posts_has_required_fields(self, reddit_importer, sample_posts_zst):
         """Test streamed posts have required fields."""
-        posts = list(reddit_importer.stream_posts(sample_posts_zst))
-
-        for post in posts:
+        for post in reddit_importer.stream_posts(sample_posts_zst):
             assert "id" in post
             assert "platform" in post
             assert "subreddit" in post
@@ -222,35 +209,72 @@ class TestStreamPosts:
 
     def test_stream_posts_platform_set(self, reddit_importer, sample_posts_zst):
         """Test platform field is set to 'reddit'."""
-        posts = list(reddit_importer.stream_posts(sample_posts_zst))
-
-        for post in posts:
+        for post in reddit_importer.stream_posts(sample_posts_zst):
             assert post["platform"] == "reddit"
 
     def test_stream_posts_with_filter(self, reddit_importer, sample_posts_zst):
         """Test post streaming with community filter."""
-        posts = list(reddit_importer.stream_posts(sample_posts_zst, filter_communities=["technology"]))
+        # islice bounds allocation while still proving there is no second match
+        posts = list(islice(reddit_importer.stream_posts(sample_posts_zst, filter_communities=["technology"]), 2))
 
         assert len(posts) == 1
         assert posts[0]["subreddit"] == "technology"
 
     def test_stream_posts_filter_case_insensitive(self, reddit_importer, sample_posts_zst):
         """Test community filter is case insensitive."""
-        posts = list(reddit_importer.stream_posts(sample_posts_zst, filter_communities=["TECHNOLOGY"]))
+        posts = list(islice(reddit_importer.stream_posts(sample_posts_zst, filter_communities=["TECHNOLOGY"]), 2))
 
         assert len(posts) == 1
         assert posts[0]["subreddit"] == "technology"
 
     def test_stream_posts_preserves_content(self, reddit_importer, sample_posts_zst):
         """Test post content is preserved."""
-        posts = list(reddit_importer.stream_posts(sample_posts_zst))
-
-        tech_posts = [p for p in posts if p["subreddit"] == "technology"]
+        tech_posts = [p for p in reddit_importer.stream_posts(sample_posts_zst) if p["subreddit"] == "technology"]
         assert len(tech_posts) == 1
         assert tech_posts[0]["title"] == "Test Post Title"
         assert tech_posts[0]["selftext"] == "This is the post content"
 
 
+# =============================================================================
+# PARALLEL STREAM TESTS
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestStreamPostsParallel:
+    """Tests for the parallel producer/worker streaming pipeline."""
+
+    def test_parallel_matches_serial(self, sample_posts_zst):
+        """Test parallel streaming yields exactly the serial output, in order."""
+        serial = list(RedditImporter().stream_posts(sample_posts_zst))
+        parallel = list(RedditImporter(parallel=True, workers=2).stream_posts(sample_posts_zst))
+
+        assert parallel == serial
+        assert len(parallel) >= 1
+
+    def test_parallel_with_filter(self, sample_posts_zst):
+        """Test the community filter applies inside the workers."""
+        importer = RedditImporter(parallel=True, workers=2)
+
+        posts = list(importer.stream_posts(sample_posts_zst, filter_communities=["TECHNOLOGY"]))
+
+        assert len(posts) == 1
+        assert posts[0]["subreddit"] == "technology"
+
+    def test_worker_error_propagates(self, tmp_path, zstd_compressor):
+        """Test a worker crash raises instead of hanging the consumer."""
+        # null subreddit makes the filter's .lower() raise inside the worker
+        content = b'{"id": "1", "subreddit": null, "author": "u", "title": "t", "created_utc": 1640000000}\n'
+        zst_path = tmp_path / "null_sub_submissions.zst"
+        with open(zst_path, "wb") as f:
+            f.write(zstd_compressor.compress(content))
+
+        importer = RedditImporter(parallel=True, workers=2)
+
+        with pytest.raises(AttributeError):
+            list(importer.stream_posts(str(zst_path), filter_communities=["technology"]))
+
+
 # =============================================================================
 # STREAM COMMENTS TESTS
 # =============================================================================
@@ -262,16 +286,14 @@ class TestStreamComments:
 
     def test_stream_comments_basic(self, reddit_importer, sample_comments_zst):
         """Test basic comment streaming."""
-        comments = list(reddit_importer.stream_comments(sample_comments_zst))
+        first = next(reddit_importer.stream_comments(sample_comments_zst), None)
 
         # At least 1 comment should be streamed
-        assert len(comments) >= 1
+        assert first is not None
 
     def test_stream_comments_has_required_fields(self, reddit_importer, sample_comments_zst):
         """Test streamed comments have required fields."""
-        comments = list(reddit_importer.stream_comments(sample_comments_zst))
-
-        for comment in comments:
+        for comment in reddit_importer.stream_comments(sample_comments_zst):
             assert "id" in comment
             assert "platform" in comment
             assert "subreddit" in comment
@@ -283,14 +305,12 @@ class TestStreamComments:
 
     def test_stream_comments_platform_set(self, reddit_importer, sample_comments_zst):
         """Test platform field is set to 'reddit'."""
-        comments = list(reddit_importer.stream_comments(sample_comments_zst))
-
-        for comment in comments:
+        for comment in reddit_importer.stream_comments(sample_comments_zst):
             assert comment["platform"] == "reddit"
 
     def test_stream_comments_with_filter(self, reddit_importer, sample_comments_zst):
         """Test comment streaming with community filter."""
-        comments = list(reddit_importer.stream_comments(sample_comments_zst, filter_communities=["technology"]))
+        comments = list(islice(reddit_importer.stream_comments(sample_comments_zst, filter_communities=["technology"]), 2))
 
         # At least 1 comment from technology should be streamed
         assert len(comments) >= 1
@@ -298,10 +318,8 @@ class TestStreamComments:
 
     def test_stream_comments_post_id_extracted(self, reddit_importer, sample_comments_zst):
         """Test post_id is correctly extracted from link_id."""
-        comments = list(reddit_importer.stream_comments(sample_comments_zst))
-
         # post_id should be extracted from t3_abc123 -> abc123 (possibly prefixed)
-        for comment in comments:
+        for comment in reddit_importer.stream_comments(sample_comments_zst):
             assert comment["post_id"] is not None
             assert len(comment["post_id"]) > 0
 
@@ -444,6 +462,81 @@ class TestNormalizeComment:
         assert "comment789" in normalized["parent_id"] or normalized["parent_id"].endswith("comment789")
 
 
+# =============================================================================
+# BINARY COPY IMPORT TESTS (Database required)
+# =============================================================================
+
+
+@pytest.mark.db
+class TestBinaryCopyImport:
+    """Integration tests for the binary-COPY ingestion path (requires database)."""
+
+    def _cleanup(self, postgres_db, subreddits: tuple[str, ...]):
+        with postgres_db.pool.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM comments WHERE subreddit = ANY(%s)", (list(subreddits),))
+                cur.execute("DELETE FROM posts WHERE subreddit = ANY(%s)", (list(subreddits),))
+                conn.commit()
+
+    def test_import_posts(self, reddit_importer, sample_posts_zst, postgres_db):
+        """Test posts stream into the database via binary COPY."""
+        successful, failed = reddit_importer.import_posts(sample_posts_zst, postgres_db)
+
+        assert successful == 2
+        assert failed == 0
+
+        with postgres_db.pool.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT COUNT(*) AS count FROM posts WHERE id IN ('reddit_abc123', 'reddit_def456')")
+                assert cur.fetchone()["count"] == 2
+
+        self._cleanup(postgres_db, ("technology", "privacy"))
+
+    def test_import_posts_is_rerunnable(self, reddit_importer, sample_posts_zst, postgres_db):
+        """Test re-importing the same archive upserts instead of failing."""
+        reddit_importer.import_posts(sample_posts_zst, postgres_db)
+        successful, failed = reddit_importer.import_posts(sample_posts_zst, postgres_db)
+
+        assert successful == 2
+        assert failed == 0
+
+        self._cleanup(postgres_db, ("technology", "privacy"))
+
+    def test_import_comments(self, reddit_importer, sample_posts_zst, sample_comments_zst, postgres_db):
+        """Test comments stream into the database via binary COPY."""
+        reddit_importer.import_posts(sample_posts_zst, postgres_db)
+        successful, failed = reddit_importer.import_comments(sample_comments_zst, postgres_db)
+
+        assert successful == 2
+        assert failed == 0
+
+        with postgres_db.pool.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT COUNT(*) AS count FROM comments WHERE id IN ('reddit_xyz789', 'reddit_uvw012')")
+                assert cur.fetchone()["count"] == 2
+
+        self._cleanup(postgres_db, ("technology", "privacy"))
+
+    def test_import_posts_sanitizes_json_data(self, reddit_importer, tmp_path, zstd_compressor, postgres_db):
+        """Test unserializable json_data values are sanitized, not batch-fatal."""
+        # "Infinity" strings are the sanitizer's canonical problem input
+        # (orjson rejects bare non-finite number literals at parse time)
+        content = (
+            b'{"id": "nan1", "subreddit": "test_copy_nan", "author": "u", "title": "t",'
+            b' "created_utc": 1640000000, "upvote_ratio": "Infinity"}\n'
+        )
+        zst_path = tmp_path / "nan_submissions.zst"
+        with open(zst_path, "wb") as f:
+            f.write(zstd_compressor.compress(content))
+
+        successful, failed = reddit_importer.import_posts(str(zst_path), postgres_db)
+
+        assert successful == 1
+        assert failed == 0
+
+        self._cleanup(postgres_db, ("test_copy_nan",))
+
+
 # =============================================================================
 # MALFORMED DATA TESTS
 # =============================================================================
@@ -453,12 +546,11 @@ class TestNormalizeComment:
 class TestMalformedData:
     """Tests for handling malformed data."""
 
-    def test_stream_posts_handles_invalid_json(self, reddit_importer, tmp_path):
+    def test_stream_posts_handles_invalid_json(self, reddit_importer, tmp_path, zstd_compressor):
         """Test streaming handles invalid JSON lines gracefully."""
-        content = '{"valid": true}\nnot json\n{"also_valid": true}'
+        content = b'{"valid": true}\nnot json\n{"also_valid": true}'
         zst_path = tmp_path / "malformed_posts.zst"
-        compressor = zstandard.ZstdCompressor()
-        compressed = compressor.compress(content.encode("utf-8"))
+        compressed = zstd_compressor.compress(content)
 
         with open(zst_path, "wb") as f:
             f.write(compressed)
@@ -469,19 +561,15 @@ class TestMalformedData:
         # May return 0 posts if none have required fields
         assert isinstance(posts, list)
 
-    def test_stream_posts_handles_empty_lines(self, reddit_importer, tmp_path):
+    def test_stream_posts_handles_empty_lines(self, reddit_importer, tmp_path, zstd_compressor):
         """Test streaming handles empty lines."""
-        posts_data = [
-            {"id": "1", "subreddit": "test", "author": "u", "title": "t", "created_utc": 1640000000},
-        ]
-        content = "\n" + json.dumps(posts_data[0]) + "\n\n"
+        content = b'\n{"id": "1", "subreddit": "test", "author": "u", "title": "t", "created_utc": 1640000000}\n\n'
         zst_path = tmp_path / "empty_lines_posts.zst"
-        compressor = zstandard.ZstdCompressor()
-        compressed = compressor.compress(content.encode("utf-8"))
+        compressed = zstd_compressor.compress(content)
 
         with open(zst_path, "wb") as f:
             f.write(compressed)
 
-        posts = list(reddit_importer.stream_posts(str(zst_path)))
+        posts = list(islice(reddit_importer.stream_posts(str(zst_path)), 2))
 
         assert len(posts) == 1
@@ -9,7 +9,7 @@ import re
 
 import pytest
 
-from utils.regex_utils import RegexTimeout, SafeRegex, safe_regex
+from utils.regex_utils import RegexTimeout, SafeRegex, _leftmost_longest, safe_regex
 from utils.regex_utils import findall as safe_findall
 from utils.regex_utils import search as safe_search
 from utils.regex_utils import sub as safe_sub
@@ -121,6 +121,57 @@ class TestNormalPatterns:
         assert result is None
 
 
+# =============================================================================
+# MULTI-PATTERN TESTS
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestFindallMulti:
+    """Tests for findall_multi multi-pattern scanning.
+
+    Covers the sequential fallback path; the hyperscan branch is gated on
+    an optional dependency and produces the same return shape.
+    """
+
+    def test_multiple_patterns(self, fresh_regex):
+        """Test each pattern gets its own match list."""
+        result = fresh_regex.findall_multi([r"\d+", r"[a-z]+"], "a1b22c")
+
+        assert result == {r"\d+": ["1", "22"], r"[a-z]+": ["a", "b", "c"]}
+
+    def test_no_matches(self, fresh_regex):
+        """Test patterns without matches map to empty lists."""
+        result = fresh_regex.findall_multi([r"\d+", r"xyz"], "no numbers here")
+
+        assert result == {r"\d+": [], r"xyz": []}
+
+    def test_empty_pattern_list(self, fresh_regex):
+        """Test empty pattern list returns empty dict."""
+        assert fresh_regex.findall_multi([], "some text") == {}
+
+    def test_unicode_text(self, fresh_regex):
+        """Test multi-pattern scan over non-ASCII text."""
+        result = fresh_regex.findall_multi([r"\d+"], "héllo 世界 42")
+
+        assert result == {r"\d+": ["42"]}
+
+    def test_leftmost_longest_normalization(self):
+        """Test hyperscan-style raw spans collapse to re.findall's matches.
+
+        Hyperscan reports one span per reachable end offset; for \\d+ over
+        "a1b22c" that is (1,2), (3,4), (3,5) and (4,5), which must reduce
+        to the (1,2) and (3,5) that re.findall returns.
+        """
+        spans = [(1, 2), (3, 4), (3, 5), (4, 5)]
+
+        assert _leftmost_longest(spans) == [(1, 2), (3, 5)]
+
+    def test_leftmost_longest_empty(self):
+        """Test no spans reduce to no matches."""
+        assert _leftmost_longest([]) == []
+
+
 # =============================================================================
 # CONVENIENCE FUNCTION TESTS
 # =============================================================================
@@ -4,10 +4,12 @@ ABOUTME: Unit tests for Ruqqus .7z archive importer
 ABOUTME: Tests file detection, field normalization, and guild-to-subreddit mapping
 """
 
+import copy
 import io
-import json
+from itertools import islice
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 
 from core.importers.ruqqus_importer import RuqqusImporter
@@ -17,70 +19,94 @@ from core.importers.ruqqus_importer import RuqqusImporter
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ruqqus_importer():
-    """Create a fresh RuqqusImporter instance."""
+    """Shared RuqqusImporter instance - the importer is stateless across
+    tests, so one object serves the whole session."""
     return RuqqusImporter()
 
 
+@pytest.fixture(scope="session")
+def ruqqus_archive_dir(tmp_path_factory):
+    """Canonical Ruqqus archive directory with empty .7z placeholders.
+
+    Session-scoped: detect_files only looks at filenames, so the
+    detection tests can all share one directory instead of touching
+    files per test.
+    """
+    archive_dir = tmp_path_factory.mktemp("ruqqus_archives")
+    (archive_dir / "submissions.f1.2021-10-30.txt.sort.2021-11-10.7z").touch()
+    (archive_dir / "comments.fx.2021-10-30.txt.sort.2021-11-08.7z").touch()
+    return archive_dir
+
+
+# Module-level sample templates: fixtures hand out fresh deep copies so
+# tests can mutate freely without re-declaring the dicts each time
+_SAMPLE_POST = {
+    "id": "abc123",
+    "guild_name": "Technology",
+    "author_name": "ruqqus_user",
+    "title": "Ruqqus Post Title",
+    "body": "This is the post body content",
+    "url": "https://example.com",
+    "domain": "example.com",
+    "permalink": "/+Technology/post/abc123",
+    "created_utc": 1633000000,
+    "score": 50,
+    "upvotes": 60,
+    "downvotes": 10,
+    "comment_count": 15,
+    "is_nsfw": False,
+    "is_archived": False,
+}
+
+_SAMPLE_COMMENT = {
+    "id": "xyz789",
+    "post_id": "abc123",
+    "guild": {"name": "Technology", "id": "guild123"},
+    "author_name": "commenter",
+    "body": "Great post!",
+    "permalink": "/+Technology/post/abc123/comment/xyz789",
+    "created_utc": 1633000100,
+    "score": 10,
+    "upvotes": 12,
+    "downvotes": 2,
+    "level": 0,
+    "parent_comment_id": [],  # Top-level comment
+}
+
+_SAMPLE_REPLY = {
+    "id": "uvw456",
+    "post_id": "abc123",
+    "guild": {"name": "Technology", "id": "guild123"},
+    "author_name": "replier",
+    "body": "I agree!",
+    "permalink": "/+Technology/post/abc123/comment/uvw456",
+    "created_utc": 1633000200,
+    "score": 5,
+    "upvotes": 6,
+    "downvotes": 1,
+    "level": 1,
+    "parent_comment_id": ["xyz789"],  # Reply to xyz789
+}
+
+
 @pytest.fixture
 def sample_ruqqus_post():
-    """Sample Ruqqus post data."""
-    return {
-        "id": "abc123",
-        "guild_name": "Technology",
-        "author_name": "ruqqus_user",
-        "title": "Ruqqus Post Title",
-        "body": "This is the post body content",
-        "url": "https://example.com",
-        "domain": "example.com",
-        "permalink": "/+Technology/post/abc123",
-        "created_utc": 1633000000,
-        "score": 50,
-        "upvotes": 60,
-        "downvotes": 10,
-        "comment_count": 15,
-        "is_nsfw": False,
-        "is_archived": False,
-    }
+    """Fresh copy of the sample Ruqqus post data."""
+    return copy.deepcopy(_SAMPLE_POST)
 
 
 @pytest.fixture
 def sample_ruqqus_comment():
-    """Sample Ruqqus comment data."""
-    return {
-        "id": "xyz789",
-        "post_id": "abc123",
-        "guild": {"name": "Technology", "id": "guild123"},
-        "author_name": "commenter",
-        "body": "Great post!",
-        "permalink": "/+Technology/post/abc123/comment/xyz789",
-        "created_utc": 1633000100,
-        "score": 10,
-        "upvotes": 12,
-        "downvotes": 2,
-        "level": 0,
-        "parent_comment_id": [],  # Top-level comment
-    }
+    """Fresh copy of the sample Ruqqus comment data."""
+    return copy.deepcopy(_SAMPLE_COMMENT)
 
 
 @pytest.fixture
 def sample_ruqqus_reply():
-    """Sample Ruqqus comment reply data."""
-    return {
-        "id": "uvw456",
-        "post_id": "abc123",
-        "guild": {"name": "Technology", "id": "guild123"},
-        "author_name": "replier",
-        "body": "I agree!",
-        "permalink": "/+Technology/post/abc123/comment/uvw456",
-        "created_utc": 1633000200,
-        "score": 5,
-        "upvotes": 6,
-        "downvotes": 1,
-        "level": 1,
-        "parent_comment_id": ["xyz789"],  # Reply to xyz789
-    }
+    """Fresh copy of the sample Ruqqus reply data."""
+    return copy.deepcopy(_SAMPLE_REPLY)
 
 
 # =============================================================================
@@ -112,24 +138,17 @@ class TestPlatformId:
 class TestDetectFiles:
     """Tests for detect_files method."""
 
-    def test_detect_submission_files(self, ruqqus_importer, tmp_path):
+    def test_detect_submission_files(self, ruqqus_importer, ruqqus_archive_dir):
         """Test detection of submission files."""
-        # Create dummy 7z files
-        (tmp_path / "submissions.f1.2021-10-30.txt.sort.2021-11-10.7z").touch()
-        (tmp_path / "comments.fx.2021-10-30.txt.sort.2021-11-08.7z").touch()
-
-        files = ruqqus_importer.detect_files(str(tmp_path))
+        files = ruqqus_importer.detect_files(str(ruqqus_archive_dir))
 
         assert "posts" in files
         assert len(files["posts"]) == 1
         assert "submission" in files["posts"][0]
 
-    def test_detect_comment_files(self, ruqqus_importer, tmp_path):
+    def test_detect_comment_files(self, ruqqus_importer, ruqqus_archive_dir):
         """Test detection of comment files."""
-        (tmp_path / "submissions.7z").touch()
-        (tmp_path / "comments.7z").touch()
-
-        files = ruqqus_importer.detect_files(str(tmp_path))
+        files = ruqqus_importer.detect_files(str(ruqqus_archive_dir))
 
         assert "comments" in files
         assert len(files["comments"]) == 1
@@ -140,11 +159,9 @@ class TestDetectFiles:
         with pytest.raises(FileNotFoundError):
             ruqqus_importer.detect_files(str(tmp_path))
 
-    def test_detect_files_returns_dict(self, ruqqus_importer, tmp_path):
+    def test_detect_files_returns_dict(self, ruqqus_importer, ruqqus_archive_dir):
         """Test detect_files returns proper structure."""
-        (tmp_path / "submission.7z").touch()
-
-        files = ruqqus_importer.detect_files(str(tmp_path))
+        files = ruqqus_importer.detect_files(str(ruqqus_archive_dir))
 
         assert isinstance(files, dict)
         assert "posts" in files
@@ -311,49 +328,47 @@ class TestStreamPosts:
 
     def test_stream_posts_basic(self, ruqqus_importer, sample_ruqqus_post):
         """Test basic post streaming with mocked 7z."""
-        json_lines = json.dumps(sample_ruqqus_post).encode("utf-8") + b"\n"
+        json_lines = orjson.dumps(sample_ruqqus_post) + b"\n"
 
         mock_process = MagicMock()
         mock_process.stdout = io.BytesIO(json_lines)
         mock_process.wait.return_value = 0
 
         with patch("subprocess.Popen", return_value=mock_process):
-            posts = list(ruqqus_importer.stream_posts("/fake/path.7z"))
+            posts = list(islice(ruqqus_importer.stream_posts("/fake/path.7z"), 16))
 
         assert len(posts) == 1
         assert posts[0]["platform"] == "ruqqus"
 
-    def test_stream_posts_with_filter(self, ruqqus_importer, sample_ruqqus_post):
+    def test_stream_posts_with_filter(self, ruqqus_importer):
         """Test post streaming with guild filter."""
-        post1 = sample_ruqqus_post.copy()
-        post1["guild_name"] = "Technology"
+        # Build one-field overrides straight off the module template -
+        # no fixture rebuild or intermediate copy needed
+        post1 = {**_SAMPLE_POST, "guild_name": "Technology"}
+        post2 = {**_SAMPLE_POST, "id": "def456", "guild_name": "Other"}
 
-        post2 = sample_ruqqus_post.copy()
-        post2["id"] = "def456"
-        post2["guild_name"] = "Other"
-
-        json_lines = (json.dumps(post1) + "\n" + json.dumps(post2) + "\n").encode("utf-8")
+        json_lines = orjson.dumps(post1) + b"\n" + orjson.dumps(post2) + b"\n"
 
         mock_process = MagicMock()
         mock_process.stdout = io.BytesIO(json_lines)
         mock_process.wait.return_value = 0
 
         with patch("subprocess.Popen", return_value=mock_process):
-            posts = list(ruqqus_importer.stream_posts("/fake/path.7z", filter_communities=["Technology"]))
+            posts = list(islice(ruqqus_importer.stream_posts("/fake/path.7z", filter_communities=["Technology"]), 16))
 
         # Only Technology guild should be included
         assert all(p["subreddit"] == "Technology" for p in posts)
 
     def test_stream_posts_handles_empty_lines(self, ruqqus_importer, sample_ruqqus_post):
         """Test streaming handles empty lines."""
-        json_lines = b"\n" + json.dumps(sample_ruqqus_post).encode("utf-8") + b"\n\n"
+        json_lines = b"\n" + orjson.dumps(sample_ruqqus_post) + b"\n\n"
 
         mock_process = MagicMock()
         mock_process.stdout = io.BytesIO(json_lines)
         mock_process.wait.return_value = 0
 
         with patch("subprocess.Popen", return_value=mock_process):
-            posts = list(ruqqus_importer.stream_posts("/fake/path.7z"))
+            posts = list(islice(ruqqus_importer.stream_posts("/fake/path.7z"), 16))
 
         assert len(posts) == 1
 
@@ -369,40 +384,89 @@ class TestStreamComments:
 
     def test_stream_comments_basic(self, ruqqus_importer, sample_ruqqus_comment):
         """Test basic comment streaming with mocked 7z."""
-        json_lines = json.dumps(sample_ruqqus_comment).encode("utf-8") + b"\n"
+        json_lines = orjson.dumps(sample_ruqqus_comment) + b"\n"
 
         mock_process = MagicMock()
         mock_process.stdout = io.BytesIO(json_lines)
         mock_process.wait.return_value = 0
 
         with patch("subprocess.Popen", return_value=mock_process):
-            comments = list(ruqqus_importer.stream_comments("/fake/path.7z"))
+            comments = list(islice(ruqqus_importer.stream_comments("/fake/path.7z"), 16))
 
         assert len(comments) == 1
         assert comments[0]["platform"] == "ruqqus"
 
-    def test_stream_comments_with_filter(self, ruqqus_importer, sample_ruqqus_comment):
+    def test_stream_comments_with_filter(self, ruqqus_importer):
         """Test comment streaming with guild filter."""
-        comment1 = sample_ruqqus_comment.copy()
-        comment1["guild"] = {"name": "Technology", "id": "g1"}
-
-        comment2 = sample_ruqqus_comment.copy()
-        comment2["id"] = "other123"
-        comment2["guild"] = {"name": "Other", "id": "g2"}
+        comment1 = {**_SAMPLE_COMMENT, "guild": {"name": "Technology", "id": "g1"}}
+        comment2 = {**_SAMPLE_COMMENT, "id": "other123", "guild": {"name": "Other", "id": "g2"}}
 
-        json_lines = (json.dumps(comment1) + "\n" + json.dumps(comment2) + "\n").encode("utf-8")
+        json_lines = orjson.dumps(comment1) + b"\n" + orjson.dumps(comment2) + b"\n"
 
         mock_process = MagicMock()
         mock_process.stdout = io.BytesIO(json_lines)
         mock_process.wait.return_value = 0
 
         with patch("subprocess.Popen", return_value=mock_process):
-            comments = list(ruqqus_importer.stream_comments("/fake/path.7z", filter_communities=["Technology"]))
+            comments = list(islice(ruqqus_importer.stream_comments("/fake/path.7z", filter_communities=["Technology"]), 16))
 
         # Only Technology guild should be included
         assert all(c["subreddit"] == "Technology" for c in comments)
 
 
+# =============================================================================
+# PARALLEL STREAM TESTS (with mocked subprocess)
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestStreamPostsParallel:
+    """Tests for stream_posts_parallel with mocked 7z subprocess."""
+
+    def _pipe_payload(self, count: int) -> bytes:
+        """Build an NDJSON pipe payload of `count` alternating-guild posts."""
+        posts = [
+            {**_SAMPLE_POST, "id": f"par{i}", "guild_name": "Technology" if i % 2 else "Other"}
+            for i in range(count)
+        ]
+        return b"\n".join(orjson.dumps(p) for p in posts) + b"\n"
+
+    def test_parallel_matches_serial(self, ruqqus_importer):
+        """Test parallel streaming yields exactly the serial output, in order."""
+        payload = self._pipe_payload(20)
+
+        def run(method, **kwargs):
+            mock_process = MagicMock()
+            mock_process.stdout = io.BytesIO(payload)
+            mock_process.wait.return_value = 0
+            with patch("subprocess.Popen", return_value=mock_process):
+                return list(method("/fake/path.7z", **kwargs))
+
+        serial = run(ruqqus_importer.stream_posts)
+        parallel = run(ruqqus_importer.stream_posts_parallel, workers=2, chunk_lines=4)
+
+        assert parallel == serial
+        assert len(parallel) == 20
+
+    def test_parallel_with_filter(self, ruqqus_importer):
+        """Test guild filter applies inside the workers."""
+        payload = self._pipe_payload(10)
+
+        mock_process = MagicMock()
+        mock_process.stdout = io.BytesIO(payload)
+        mock_process.wait.return_value = 0
+
+        with patch("subprocess.Popen", return_value=mock_process):
+            posts = list(
+                ruqqus_importer.stream_posts_parallel(
+                    "/fake/path.7z", filter_communities=["Technology"], workers=2, chunk_lines=3
+                )
+            )
+
+        assert len(posts) == 5
+        assert all(p["subreddit"] == "Technology" for p in posts)
+
+
 # =============================================================================
 # EDGE CASES
 # =============================================================================
@@ -13,6 +13,8 @@ from core.watchful import (
     _flush_batch_to_database,
     _should_include_record,
     read_lines_zst,
+    read_lines_zst_many,
+    stream_many,
     stream_to_database,
 )
 
@@ -20,10 +22,18 @@ from core.watchful import (
 # TEST FIXTURES
 # =============================================================================
 
+# One compressor shared by every fixture: contexts are reusable across
+# sequential compress() calls and construction is not free
+_COMPRESSOR = zstandard.ZstdCompressor()
 
-@pytest.fixture
-def sample_zst_file(tmp_path):
-    """Create a sample .zst file with JSON lines."""
+
+@pytest.fixture(scope="module")
+def sample_zst_file(tmp_path_factory):
+    """Create a sample .zst file with JSON lines.
+
+    Module-scoped: the tests only read the file, so the JSON encode and
+    zstd compression run once instead of per test.
+    """
     posts = [
         {"id": "post_1", "subreddit": "test", "author": "user1", "title": "Post 1", "created_utc": 1640000000},
         {"id": "post_2", "subreddit": "test", "author": "user2", "title": "Post 2", "created_utc": 1640001000},
@@ -34,9 +44,8 @@ def sample_zst_file(tmp_path):
     content = "\n".join(json.dumps(post) for post in posts)
 
     # Compress with zstandard
-    zst_path = tmp_path / "test_posts.zst"
-    compressor = zstandard.ZstdCompressor()
-    compressed = compressor.compress(content.encode("utf-8"))
+    zst_path = tmp_path_factory.mktemp("watchful") / "test_posts.zst"
+    compressed = _COMPRESSOR.compress(content.encode("utf-8"))
 
     with open(zst_path, "wb") as f:
         f.write(compressed)
@@ -44,8 +53,8 @@ def sample_zst_file(tmp_path):
     return str(zst_path)
 
 
-@pytest.fixture
-def sample_comments_zst_file(tmp_path):
+@pytest.fixture(scope="module")
+def sample_comments_zst_file(tmp_path_factory):
     """Create a sample .zst file with comment JSON lines."""
     comments = [
         {
@@ -69,9 +78,8 @@ def sample_comments_zst_file(tmp_path):
     ]
 
     content = "\n".join(json.dumps(comment) for comment in comments)
-    zst_path = tmp_path / "test_comments.zst"
-    compressor = zstandard.ZstdCompressor()
-    compressed = compressor.compress(content.encode("utf-8"))
+    zst_path = tmp_path_factory.mktemp("watchful") / "test_comments.zst"
+    compressed = _COMPRESSOR.compress(content.encode("utf-8"))
 
     with open(zst_path, "wb") as f:
         f.write(compressed)
@@ -79,8 +87,8 @@ def sample_comments_zst_file(tmp_path):
     return str(zst_path)
 
 
-@pytest.fixture
-def malformed_zst_file(tmp_path):
+@pytest.fixture(scope="module")
+def malformed_zst_file(tmp_path_factory):
     """Create a .zst file with some malformed JSON lines."""
     lines = [
         '{"id": "valid_1", "subreddit": "test", "author": "user1", "created_utc": 1640000000}',
@@ -90,9 +98,8 @@ def malformed_zst_file(tmp_path):
     ]
 
     content = "\n".join(lines)
-    zst_path = tmp_path / "malformed.zst"
-    compressor = zstandard.ZstdCompressor()
-    compressed = compressor.compress(content.encode("utf-8"))
+    zst_path = tmp_path_factory.mktemp("watchful") / "malformed.zst"
+    compressed = _COMPRESSOR.compress(content.encode("utf-8"))
 
     with open(zst_path, "wb") as f:
         f.write(compressed)
@@ -115,9 +122,10 @@ class TestReadLinesZst:
 
         # At least 2 lines should be read (newline handling may vary)
         assert len(lines) >= 2
-        # Each line is a tuple of (content, position)
+        # Each line is a tuple of (bytes content, position) - the reader
+        # skips the UTF-8 decode since all consumers accept bytes
         for line, position in lines:
-            assert isinstance(line, str)
+            assert isinstance(line, bytes)
             assert isinstance(position, int)
 
     def test_read_yields_line_and_position(self, sample_zst_file):
@@ -138,8 +146,7 @@ class TestReadLinesZst:
     def test_read_empty_file(self, tmp_path):
         """Test reading an empty compressed file."""
         zst_path = tmp_path / "empty.zst"
-        compressor = zstandard.ZstdCompressor()
-        compressed = compressor.compress(b"")
+        compressed = _COMPRESSOR.compress(b"")
 
         with open(zst_path, "wb") as f:
             f.write(compressed)
@@ -148,6 +155,110 @@ class TestReadLinesZst:
         assert len(lines) == 0
 
 
+# =============================================================================
+# MULTI-SHARD READ TESTS
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestReadLinesZstMany:
+    """Tests for read_lines_zst_many multi-shard streaming."""
+
+    def _write_shard(self, tmp_path, name, content: bytes) -> str:
+        zst_path = tmp_path / name
+        with open(zst_path, "wb") as f:
+            f.write(_COMPRESSOR.compress(content))
+        return str(zst_path)
+
+    def test_lines_across_shards(self, tmp_path):
+        """Test lines stream across shards in file order."""
+        shard1 = self._write_shard(tmp_path, "a.zst", b'{"id": "1"}\n{"id": "2"}\n')
+        shard2 = self._write_shard(tmp_path, "b.zst", b'{"id": "3"}\n')
+
+        lines = [line for line in read_lines_zst_many([shard1, shard2]) if line]
+
+        assert lines == [b'{"id": "1"}', b'{"id": "2"}', b'{"id": "3"}']
+
+    def test_shard_without_trailing_newline(self, tmp_path):
+        """Test a shard's final unterminated line never merges into the next shard."""
+        shard1 = self._write_shard(tmp_path, "a.zst", b'{"id": "1"}\n{"id": "2"}')
+        shard2 = self._write_shard(tmp_path, "b.zst", b'{"id": "3"}\n')
+
+        lines = [line for line in read_lines_zst_many([shard1, shard2]) if line]
+
+        assert lines == [b'{"id": "1"}', b'{"id": "2"}', b'{"id": "3"}']
+
+    def test_empty_file_list(self):
+        """Test no shards yields nothing."""
+        assert list(read_lines_zst_many([])) == []
+
+
+# =============================================================================
+# PARALLEL MULTI-SHARD STREAMING TESTS
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestStreamManyUnit:
+    """Unit tests for stream_many that need no database."""
+
+    def test_empty_file_list(self):
+        """Test no shards returns zeroed statistics without touching the pool."""
+        result = stream_many([], "postgresql://unused/unused", "posts")
+
+        assert result["records_processed"] == 0
+        assert result["files_processed"] == 0
+        assert result["processing_time"] == 0.0
+
+
+@pytest.mark.db
+class TestStreamMany:
+    """Integration tests for parallel multi-shard streaming (requires database)."""
+
+    def _write_shard(self, tmp_path, name: str, posts: list[dict]) -> str:
+        content = "\n".join(json.dumps(post) for post in posts)
+        zst_path = tmp_path / name
+        with open(zst_path, "wb") as f:
+            f.write(_COMPRESSOR.compress(content.encode("utf-8")))
+        return str(zst_path)
+
+    def test_stream_many_aggregates_across_shards(self, tmp_path, postgres_db):
+        """Test two shards ingest in parallel and stats aggregate."""
+        shard1 = self._write_shard(
+            tmp_path,
+            "many_a.zst",
+            [
+                {"id": "many_1", "subreddit": "test_many", "author": "u1", "title": "A", "created_utc": 1640000000},
+                {"id": "many_2", "subreddit": "test_many", "author": "u2", "title": "B", "created_utc": 1640001000},
+            ],
+        )
+        shard2 = self._write_shard(
+            tmp_path,
+            "many_b.zst",
+            [
+                {"id": "many_3", "subreddit": "test_many", "author": "u3", "title": "C", "created_utc": 1640002000},
+            ],
+        )
+
+        result = stream_many([shard1, shard2], postgres_db.connection_string, "posts", max_workers=2)
+
+        assert result["records_processed"] == 3
+        assert result["files_processed"] == 2
+        assert result["bad_lines"] == 0
+        assert result["processing_time"] > 0
+
+        with postgres_db.pool.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT COUNT(*) AS count FROM posts WHERE subreddit = 'test_many'")
+                assert cur.fetchone()["count"] == 3
+
+        # Cleanup
+        with postgres_db.pool.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM posts WHERE subreddit = 'test_many'")
+                conn.commit()
+
+
 # =============================================================================
 # SHOULD INCLUDE RECORD TESTS
 # =============================================================================
@@ -419,8 +530,7 @@ class TestLargeFileStreaming:
 
         content = "\n".join(json.dumps(post) for post in posts)
         zst_path = tmp_path / "large_test.zst"
-        compressor = zstandard.ZstdCompressor()
-        compressed = compressor.compress(content.encode("utf-8"))
+        compressed = _COMPRESSOR.compress(content.encode("utf-8"))
 
         with open(zst_path, "wb") as f:
             f.write(compressed)
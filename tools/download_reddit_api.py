@@ -20,7 +20,11 @@ Usage:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 import json
+import orjson
 import zstandard as zstd
 import argparse
 import time
@@ -30,66 +34,93 @@ from datetime import datetime
 from pathlib import Path
 
 
+# Characters stripped from line-delimited subreddit entries, in one pass
+_SUBREDDIT_STRIP = " \t\r\n\"',"
+
 API_BASE = "https://arctic-shift.photon-reddit.com/api"
 DEFAULT_DELAY = 0.5  # Seconds between requests
 MAX_FETCH_FOR_RANDOM = 10000  # Max records to fetch before random sampling
 
+# Pooled keep-alive session: one TCP+TLS handshake amortized over
+# thousands of paged calls, with backoff retries for transient server
+# errors. 429 stays out of the retry list - the pagination loop handles
+# rate limiting itself using the API's reset header.
+_SESSION = requests.Session()
+_SESSION.mount(
+    'https://',
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504]),
+    ),
+)
+
 
 def load_subreddits_from_file(filepath: str) -> list[str]:
     """Load subreddit list from a file (supports .txt, .json, or line-delimited)."""
     path = Path(filepath)
-    content = path.read_text().strip()
 
-    # Try JSON first
-    if path.suffix == '.json' or content.startswith('['):
+    # JSON array inputs parse in one shot - detected by suffix, or by a
+    # peek at the first non-whitespace byte for suffix-less lists, so
+    # plain text files are never read twice
+    if path.suffix == '.json':
+        data = path.read_bytes()
+    else:
+        with open(path, 'rb') as f:
+            head = f.read(16)
+        data = path.read_bytes() if head.lstrip().startswith(b'[') else None
+
+    if data is not None:
         try:
-            subs = json.loads(content)
+            subs = json.loads(data)
             if isinstance(subs, list):
                 return [s.strip() for s in subs if isinstance(s, str)]
         except json.JSONDecodeError:
             pass
 
-    # Fall back to line-delimited
+    # Line-delimited: stream the file instead of materializing the whole
+    # content plus a splitlines() copy for multi-thousand-entry lists
     subs = []
-    for line in content.splitlines():
-        line = line.strip().strip('"').strip("'").strip(',')
-        if line and not line.startswith('#'):
-            subs.append(line)
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            # One C-level strip pass instead of four chained ones; also
+            # handles mixed trailing punctuation like '"name",' correctly
+            line = line.strip(_SUBREDDIT_STRIP)
+            if line and not line.startswith('#'):
+                subs.append(line)
 
     return subs
 
 
-def download_content(
+def iter_content(
     endpoint: str,
     subreddit: str,
     start_ts: int,
     end_ts: int | None,
-    limit: int,
-    random_sample: bool = True,
+    fetch_limit: int,
     verbose: bool = True
-) -> list[dict]:
+):
     """
-    Download posts or comments from Arctic Shift API with pagination.
+    Yield posts or comments from the Arctic Shift API page by page.
+
+    Shared pagination/rate-limit core of download_content. Memory stays
+    O(one API page) for callers that consume records as they arrive.
 
     Args:
         endpoint: 'posts' or 'comments'
         subreddit: Subreddit name
         start_ts: Start timestamp (epoch seconds)
         end_ts: End timestamp (epoch seconds), None for latest
-        limit: Max records to return
-        random_sample: If True, fetch all records and randomly sample `limit`
+        fetch_limit: Max records to yield
         verbose: Print progress
 
-    Returns:
-        List of record dicts
+    Yields:
+        Record dicts in API (newest-first) order
     """
-    records = []
+    fetched = 0
     before = end_ts
 
-    # If random sampling, we need to fetch more than limit to sample from
-    fetch_limit = MAX_FETCH_FOR_RANDOM if random_sample else limit
-
-    while len(records) < fetch_limit:
+    while fetched < fetch_limit:
         params = {
             'subreddit': subreddit,
             'after': start_ts,
@@ -100,7 +131,7 @@ def download_content(
             params['before'] = before
 
         try:
-            resp = requests.get(
+            resp = _SESSION.get(
                 f"{API_BASE}/{endpoint}/search",
                 params=params,
                 timeout=30
@@ -129,16 +160,17 @@ def download_content(
             if not data:
                 break
 
-            records.extend(data)
+            for record in data:
+                yield record
+                fetched += 1
+                if fetched >= fetch_limit:
+                    return
 
             # Paginate backwards in time
             before = data[-1].get('created_utc')
 
-            if verbose and len(records) % 100 == 0:
-                if random_sample:
-                    print(f"  {endpoint}: fetched {len(records)} (will sample {limit})", end='\r')
-                else:
-                    print(f"  {endpoint}: {len(records)}/{limit}", end='\r')
+            if verbose and fetched % 100 == 0:
+                print(f"  {endpoint}: fetched {fetched}", end='\r')
 
             time.sleep(DEFAULT_DELAY)
 
@@ -152,45 +184,134 @@ def download_content(
                 print(f"  Error: {e}")
             break
 
-    # Random sampling
-    if random_sample and len(records) > limit:
-        if verbose:
-            print(f"  {endpoint}: randomly sampling {limit} from {len(records)} records")
-        records = random.sample(records, limit)
-    elif len(records) > limit:
-        records = records[:limit]
 
-    return records
+def download_content(
+    endpoint: str,
+    subreddit: str,
+    start_ts: int,
+    end_ts: int | None,
+    limit: int,
+    random_sample: bool = True,
+    verbose: bool = True
+) -> list[dict]:
+    """
+    Download posts or comments from Arctic Shift API with pagination.
+
+    With random_sample=True the stream is reservoir-sampled (Vitter's
+    Algorithm R): at most `limit` records are held at any time even
+    though up to MAX_FETCH_FOR_RANDOM are examined. Callers that don't
+    need sampling should prefer iter_content + streaming writes to keep
+    memory O(page).
+
+    Args:
+        endpoint: 'posts' or 'comments'
+        subreddit: Subreddit name
+        start_ts: Start timestamp (epoch seconds)
+        end_ts: End timestamp (epoch seconds), None for latest
+        limit: Max records to return
+        random_sample: If True, uniformly sample `limit` from the stream
+        verbose: Print progress
+
+    Returns:
+        List of record dicts
+    """
+    if not random_sample:
+        records = list(iter_content(endpoint, subreddit, start_ts, end_ts, limit, verbose))
+        return records[:limit]
+
+    # Reservoir sampling: each of the up-to-MAX_FETCH_FOR_RANDOM records
+    # ends up in the reservoir with probability limit/seen - the same
+    # distribution as random.sample over the full buffered list, without
+    # ever holding more than `limit` dicts
+    reservoir: list[dict] = []
+    seen = 0
+    for record in iter_content(endpoint, subreddit, start_ts, end_ts, MAX_FETCH_FOR_RANDOM, verbose):
+        if seen < limit:
+            reservoir.append(record)
+        else:
+            j = random.randint(0, seen)
+            if j < limit:
+                reservoir[j] = record
+        seen += 1
 
+    if verbose and seen > limit:
+        print(f"  {endpoint}: randomly sampled {limit} from {seen} records")
 
-def write_zst(records: list[dict], output_path: Path):
-    """Write records to a .zst compressed NDJSON file."""
-    cctx = zstd.ZstdCompressor(level=3)
+    return reservoir
 
-    with open(output_path, 'wb') as f:
-        with cctx.stream_writer(f) as writer:
+
+# Flush the encode buffer to the compressor at this size
+WRITE_FLUSH_BYTES = 1 << 20
+
+# Shared compressor context: zstd contexts are reusable for sequential
+# operations, so one per process avoids re-paying context init per file
+# (the downloader is single-threaded)
+_CCTX = zstd.ZstdCompressor(level=3)
+
+
+def write_zst(records, output_path: Path) -> int:
+    """Write records to a .zst compressed NDJSON file.
+
+    Accepts any iterable (including generators straight off the API), so
+    memory stays O(flush buffer) regardless of stream length. Records are
+    serialized with orjson (C extension, already UTF-8 bytes, so no
+    per-record str build + encode pass) and handed to the compressor in
+    ~1 MiB batches instead of one write per record.
+
+    Returns:
+        Number of records written
+    """
+    count = 0
+
+    # 1 MiB OS-level write buffer: the compressor's output lands in few
+    # large write() syscalls instead of one per compressed block
+    with open(output_path, 'wb', buffering=WRITE_FLUSH_BYTES) as f:
+        with _CCTX.stream_writer(f) as writer:
+            buf = bytearray()
             for record in records:
-                line = json.dumps(record, ensure_ascii=False) + '\n'
-                writer.write(line.encode('utf-8'))
+                buf += orjson.dumps(record)
+                buf += b'\n'
+                count += 1
+                if len(buf) >= WRITE_FLUSH_BYTES:
+                    writer.write(buf)
+                    buf.clear()
+            if buf:
+                writer.write(buf)
+
+    return count
 
 
 def load_progress(progress_file: Path) -> set[str]:
-    """Load set of completed subreddits from progress file."""
-    if progress_file.exists():
+    """Load set of completed subreddits from progress file.
+
+    Reads the append-only one-name-per-line format; legacy JSON progress
+    files are parsed and converted in place so old runs still resume.
+    """
+    if not progress_file.exists():
+        return set()
+
+    text = progress_file.read_text()
+    if text.lstrip().startswith('{'):
         try:
-            data = json.loads(progress_file.read_text())
-            return set(data.get('completed', []))
+            completed = set(json.loads(text).get('completed', []))
         except (json.JSONDecodeError, KeyError):
-            pass
-    return set()
+            return set()
+        # Convert the legacy JSON blob to the line format once
+        progress_file.write_text(''.join(f'{s}\n' for s in sorted(completed)))
+        return completed
 
+    return {line.strip() for line in text.splitlines() if line.strip()}
 
-def save_progress(progress_file: Path, completed: set[str]):
-    """Save set of completed subreddits to progress file."""
-    progress_file.write_text(json.dumps({
-        'completed': list(completed),
-        'updated': datetime.now().isoformat()
-    }, indent=2))
+
+def mark_completed(progress_file: Path, subreddit: str):
+    """Append one completed subreddit to the progress log.
+
+    Append-and-flush per subreddit instead of rewriting a growing JSON
+    blob every time, which was O(N^2) write work over a long run.
+    """
+    with open(progress_file, 'a', encoding='utf-8') as f:
+        f.write(f'{subreddit}\n')
+        f.flush()
 
 
 def download_subreddit(
@@ -211,28 +332,47 @@ def download_subreddit(
     """
     stats = {'posts': 0, 'comments': 0}
 
-    # Download posts
-    if verbose:
-        print(f"  Downloading posts...")
-    posts = download_content('posts', subreddit, start_ts, end_ts, limit, random_sample, verbose)
-    stats['posts'] = len(posts)
-
-    if posts:
-        posts_file = output_dir / 'submissions' / f'{subreddit}_submissions.zst'
-        posts_file.parent.mkdir(parents=True, exist_ok=True)
-        write_zst(posts, posts_file)
-
-    # Download comments
-    if not skip_comments:
+    # One background writer thread: compressing the posts overlaps with
+    # the comments download's network wait (and rate-limit sleeps)
+    with ThreadPoolExecutor(max_workers=1) as writer_pool:
+        pending = []
+
+        def fetch_and_write(endpoint: str, subdir: str, suffix: str) -> int:
+            """Download one endpoint and write its .zst, streaming when possible."""
+            output_file = output_dir / subdir / f'{subreddit}_{suffix}.zst'
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+
+            if random_sample:
+                # Sampling needs the buffered reservoir; hand the write to
+                # the background thread so the next download starts now
+                records = download_content(endpoint, subreddit, start_ts, end_ts, limit, random_sample, verbose)
+                count = len(records)
+                if count:
+                    pending.append(writer_pool.submit(write_zst, records, output_file))
+                else:
+                    output_file.unlink(missing_ok=True)
+            else:
+                # Stream API pages straight into the compressor: O(page)
+                # memory, write is inherently interleaved with the download
+                count = write_zst(iter_content(endpoint, subreddit, start_ts, end_ts, limit, verbose), output_file)
+                if count == 0:
+                    output_file.unlink(missing_ok=True)
+            return count
+
+        # Download posts
         if verbose:
-            print(f"  Downloading comments...")
-        comments = download_content('comments', subreddit, start_ts, end_ts, limit, random_sample, verbose)
-        stats['comments'] = len(comments)
+            print(f"  Downloading posts...")
+        stats['posts'] = fetch_and_write('posts', 'submissions', 'submissions')
+
+        # Download comments
+        if not skip_comments:
+            if verbose:
+                print(f"  Downloading comments...")
+            stats['comments'] = fetch_and_write('comments', 'comments', 'comments')
 
-        if comments:
-            comments_file = output_dir / 'comments' / f'{subreddit}_comments.zst'
-            comments_file.parent.mkdir(parents=True, exist_ok=True)
-            write_zst(comments, comments_file)
+        # Surface any background write failure before reporting success
+        for future in pending:
+            future.result()
 
     return stats
 
@@ -325,13 +465,13 @@ def main():
             if verbose:
                 print(f"  Done: {stats['posts']} posts, {stats['comments']} comments")
 
-            # Save progress after each subreddit
+            # Record progress after each subreddit (append-only log)
             completed.add(subreddit)
-            save_progress(progress_file, completed)
+            mark_completed(progress_file, subreddit)
 
         except KeyboardInterrupt:
+            # Completed subreddits are already on disk via mark_completed
             print("\nInterrupted. Progress saved. Use --resume to continue.")
-            save_progress(progress_file, completed)
             sys.exit(0)
         except Exception as e:
             print(f"  Error downloading r/{subreddit}: {e}")
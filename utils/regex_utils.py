@@ -8,9 +8,46 @@ import re
 import signal
 from contextlib import contextmanager
 from re import Match
+from typing import Any
 
 from .console_output import print_warning
 
+# Optional linear-time engine: google-re2 cannot backtrack, so pathological
+# patterns simply cannot explode and no timeout machinery is needed
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+# Optional multi-pattern engine: Hyperscan compiles N patterns into one
+# SIMD-accelerated database so a text is scanned once instead of N times
+try:
+    import hyperscan as _hyperscan
+except ImportError:
+    _hyperscan = None
+
+# Decided once at import: SIGALRM is Unix-only, and re-checking per call
+# would put an attribute probe on every regex operation
+_HAS_SIGALRM = hasattr(signal, "SIGALRM")
+
+
+def _leftmost_longest(spans: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Reduce raw match spans to leftmost-longest non-overlapping spans.
+
+    Hyperscan reports every reachable end offset per match start; re.findall
+    reports one non-overlapping match per position (longest for the greedy
+    patterns used here). Keeping the longest span per start and dropping
+    overlapping starts makes both engines return the same lists.
+    """
+    spans.sort(key=lambda span: (span[0], -span[1]))
+    result = []
+    last_end = -1
+    for start, end in spans:
+        if start >= last_end:
+            result.append((start, end))
+            last_end = end
+    return result
+
 
 class RegexTimeout(Exception):
     """Raised when regex execution exceeds timeout."""
@@ -19,25 +56,48 @@ class RegexTimeout(Exception):
 
 
 class SafeRegex:
-    """Wrapper for regex operations with timeout protection against ReDoS attacks."""
+    """Wrapper for regex operations with timeout protection against ReDoS attacks.
+
+    When the optional google-re2 package is installed (engine='auto', the
+    default), operations run on RE2's linear-time engine: no catastrophic
+    backtracking is possible and no SIGALRM setup/teardown happens per call,
+    which also protects non-Unix platforms. Patterns RE2 cannot compile
+    (backreferences, lookaround) transparently fall back to the stdlib
+    engine guarded by the SIGALRM timeout.
+    """
 
-    def __init__(self, timeout_seconds: float = 0.1):
+    def __init__(self, timeout_seconds: float = 0.1, engine: str = "auto"):
         """
         Initialize safe regex wrapper.
 
         Args:
-            timeout_seconds: Maximum time allowed for regex execution (default: 0.1s)
+            timeout_seconds: Maximum time allowed for regex execution on the
+                stdlib fallback path (default: 0.1s)
+            engine: 'auto' (re2 when installed, else re), 're2' (warn and
+                fall back if unavailable), or 're' (force stdlib + SIGALRM)
         """
         self.timeout = timeout_seconds
         self._timeout_count = 0
 
+        if engine == "re2" and _re2 is None:
+            print_warning("google-re2 not installed - SafeRegex falling back to stdlib re with SIGALRM timeouts")
+        self.engine = "re2" if (engine in ("auto", "re2") and _re2 is not None) else "re"
+
+        # Compiled Hyperscan databases, keyed by pattern tuple (findall_multi)
+        self._hs_cache: dict[tuple[str, ...], Any] = {}
+
     @contextmanager
     def _timeout_context(self):
         """
         Context manager for setting timeout alarm.
 
-        Uses SIGALRM to interrupt long-running regex operations.
+        Uses SIGALRM to interrupt long-running regex operations. On
+        platforms without SIGALRM (Windows) the operation runs unguarded;
+        the re2 engine, when installed, provides the protection there.
         """
+        if not _HAS_SIGALRM:
+            yield
+            return
 
         def timeout_handler(signum, frame):
             raise RegexTimeout("Regex execution timed out")
@@ -65,6 +125,14 @@ class SafeRegex:
         Returns:
             Match object or None if no match or timeout
         """
+        if self.engine == "re2":
+            try:
+                return _re2.search(pattern, text, flags)
+            except _re2.error:
+                # RE2 can't compile this pattern (backreference, lookaround) -
+                # fall back to the timeout-guarded stdlib path
+                pass
+
         try:
             with self._timeout_context():
                 return re.search(pattern, text, flags)
@@ -87,6 +155,14 @@ class SafeRegex:
         Returns:
             Modified text, or original if timeout
         """
+        if self.engine == "re2":
+            try:
+                return _re2.sub(pattern, repl, text, flags)
+            except _re2.error:
+                # RE2 can't compile this pattern (backreference, lookaround) -
+                # fall back to the timeout-guarded stdlib path
+                pass
+
         try:
             with self._timeout_context():
                 return re.sub(pattern, repl, text, flags)
@@ -108,6 +184,14 @@ class SafeRegex:
         Returns:
             List of matches, or empty list if timeout
         """
+        if self.engine == "re2":
+            try:
+                return _re2.findall(pattern, text, flags)
+            except _re2.error:
+                # RE2 can't compile this pattern (backreference, lookaround) -
+                # fall back to the timeout-guarded stdlib path
+                pass
+
         try:
             with self._timeout_context():
                 return re.findall(pattern, text, flags)
@@ -129,6 +213,14 @@ class SafeRegex:
         Returns:
             Match object or None if no match or timeout
         """
+        if self.engine == "re2":
+            try:
+                return _re2.match(pattern, text, flags)
+            except _re2.error:
+                # RE2 can't compile this pattern (backreference, lookaround) -
+                # fall back to the timeout-guarded stdlib path
+                pass
+
         try:
             with self._timeout_context():
                 return re.match(pattern, text, flags)
@@ -138,6 +230,65 @@ class SafeRegex:
             print_warning(f"Regex timeout #{self._timeout_count} on match: {pattern[:50]}...")
             return None
 
+    def findall_multi(self, patterns: list[str], text: str) -> dict[str, list[str]]:
+        """
+        Find all matches for several patterns with a single scan of the text.
+
+        With the optional hyperscan package installed, the patterns are
+        compiled once into a multi-pattern database (cached per pattern
+        tuple) and the text is scanned a single time with Hyperscan's
+        SIMD-accelerated engine. Without it, falls back to sequential
+        timeout-protected findall calls per pattern.
+
+        Note: Hyperscan has no capture groups, so matches are the full
+        matched substrings; patterns relying on group extraction should use
+        findall directly.
+
+        Both engines return the same lists: Hyperscan's raw per-end-offset
+        reports are normalized to leftmost-longest non-overlapping matches,
+        which is what re.findall produces for the greedy patterns this
+        wrapper targets.
+
+        Args:
+            patterns: List of regex patterns
+            text: Text to search
+
+        Returns:
+            Dict mapping each pattern to its list of matched substrings
+        """
+        if _hyperscan is None:
+            return {pattern: self.findall(pattern, text) for pattern in patterns}
+
+        key = tuple(patterns)
+        db = self._hs_cache.get(key)
+        if db is None:
+            db = _hyperscan.Database()
+            # SOM_LEFTMOST so start offsets are reported (needed to slice
+            # matched substrings); UTF8 for non-ASCII text
+            flags = _hyperscan.HS_FLAG_SOM_LEFTMOST | _hyperscan.HS_FLAG_UTF8
+            db.compile(
+                expressions=[p.encode("utf-8") for p in patterns],
+                ids=list(range(len(patterns))),
+                flags=[flags] * len(patterns),
+            )
+            self._hs_cache[key] = db
+
+        data = text.encode("utf-8")
+        raw_spans: dict[int, list[tuple[int, int]]] = {i: [] for i in range(len(patterns))}
+
+        def on_match(pattern_id: int, start: int, end: int, match_flags: int, context=None) -> None:
+            raw_spans[pattern_id].append((start, end))
+
+        db.scan(data, match_event_handler=on_match)
+
+        # Hyperscan fires once per reachable end offset ("1", "2" and "22"
+        # for \d+ over "b22"); collapse to the non-overlapping matches
+        # re.findall would report so the engines are interchangeable
+        return {
+            patterns[i]: [data[start:end].decode("utf-8") for start, end in _leftmost_longest(spans)]
+            for i, spans in raw_spans.items()
+        }
+
     def get_timeout_count(self) -> int:
         """
         Get number of regex timeouts that have occurred.